@@ -6,7 +6,7 @@ import shutil
 import threading
 from pathlib import Path
 from collections import deque
-from app.core.eye_gesture import get_gesture_frame
+from app.core.eye_gesture import subscribe_gestures
 from app.core.eye_gesture import reload_gesture_detector
 
 # ---------------------------------------------------------------------
@@ -23,6 +23,13 @@ REQUIRED_FAILURES = 3
 HYSTERESIS_MARGIN = 0.05
 ROLLING_WINDOW = 6
 
+# Only these config keys are tuned here; anything else is passed through as-is
+THRESHOLD_KEYS = (
+    "closed_threshold", "open_threshold",
+    "gaze_enter_threshold", "gaze_exit_threshold",
+    "gaze_up_enter_threshold", "gaze_up_exit_threshold",
+)
+
 file_lock = threading.Lock()
 failure_counters = {"FB": 0, "SB": 0, "VSB": 0, "FL": 0, "FR": 0, "FU": 0}
 recent_outcomes = deque(maxlen=ROLLING_WINDOW)
@@ -64,7 +71,7 @@ def consider_adjustment(expected_event: str):
         return
 
     cfg = safe_load_config()
-    for k in cfg:
+    for k in THRESHOLD_KEYS:
         cfg[k] = float(cfg[k])
 
     step = STEP_SMALL if failure_counters[expected_event] < (REQUIRED_FAILURES * 2) else STEP_LARGE
@@ -85,7 +92,7 @@ def consider_adjustment(expected_event: str):
         if cfg["gaze_up_exit_threshold"] <= cfg["gaze_up_enter_threshold"] + HYSTERESIS_MARGIN:
             cfg["gaze_up_exit_threshold"] = clamp(cfg["gaze_up_enter_threshold"] + HYSTERESIS_MARGIN)
 
-    for k in cfg:
+    for k in THRESHOLD_KEYS:
         cfg[k] = round(cfg[k], 6)
 
     safe_save_config(cfg)
@@ -158,6 +165,7 @@ class CalibrationUI(tk.Toplevel):
             ("Look up", "FU")
         ]
         self.current_step = 0
+        self.gestures = subscribe_gestures()
         # --- Username entry box (TOP CENTER, White Box, Hide After Save) ---
         username_frame = tk.Frame(self, bg="#0F1115")
         username_frame.pack(pady=15)
@@ -222,10 +230,12 @@ class CalibrationUI(tk.Toplevel):
         self.start_time = time.time()
         self.label.config(text=f"Please {step_text}", foreground="#FFFFFF")
         self.status_label.config(text="Waiting for detection...", foreground="#AAAAAA")
+        # Gestures made before this prompt don't count
+        self.gestures.clear()
         self.check_event()
 
     def check_event(self):
-        event = get_gesture_frame()
+        event = self.gestures.poll()
 
         if event == self.expected_event:
             self.status_label.config(text=f"✔ {self.expected_event} detected!", foreground="#00FFC6")
@@ -249,6 +259,10 @@ class CalibrationUI(tk.Toplevel):
         self.current_step += 1
         self.run_next_step()
 
+    def destroy(self):
+        self.gestures.close()
+        super().destroy()
+
 def run_calibration_ui(root):
     """Run the Calibration UI safely inside a shared Tk root."""
     root.withdraw()
@@ -8,7 +8,7 @@ from pathlib import Path
 from app.utils.speech import speak
 from dotenv import load_dotenv
 from groq import Groq
-from app.core.eye_gesture import get_gesture_frame
+from app.core.eye_gesture import subscribe_gestures
 
 load_dotenv()
 
@@ -82,6 +82,7 @@ class DrishtiAIUI(tk.Toplevel):
         self.after(1000, self.initial_greeting)
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
+        self.gestures = subscribe_gestures()
         threading.Thread(target=self.monitor_blinks, daemon=True).start()
 
     def load_username(self):
@@ -194,9 +195,10 @@ class DrishtiAIUI(tk.Toplevel):
 
     def monitor_blinks(self):
         while self.running:
-            event = get_gesture_frame()
+            gesture = self.gestures.get_event(timeout=0.1)
             if not self.running:
                 break
+            event = gesture.name if gesture else None
             if event == "FU":
                 self.toggle_focus()
             elif self.current_focus == "suggestion":
@@ -276,6 +278,11 @@ class DrishtiAIUI(tk.Toplevel):
         if self.master:
             self.master.deiconify()
 
+    def destroy(self):
+        self.running = False
+        self.gestures.close()
+        super().destroy()
+
 
 def run_chat_ui(root):
     root.withdraw()
@@ -1,103 +1,564 @@
-import cv2
-import mediapipe as mp
+import atexit
+import os
+import threading
 import yaml
+from contextlib import contextmanager
+from time import perf_counter
 from pathlib import Path
 from app.utils.eye_gesture_detector import GestureDetector
-
-# --- Mediapipe setup ---
-BaseOptions = mp.tasks.BaseOptions
-FaceLandmarker = mp.tasks.vision.FaceLandmarker
-FaceLandmarkerOptions = mp.tasks.vision.FaceLandmarkerOptions
-VisionRunningMode = mp.tasks.vision.RunningMode
+from app.utils.hmm_gesture_detector import HmmGestureDetector
+from app.utils.signal_filters import make_filter_factory
+from app.utils.blink_duration_model import BlinkDurationModel
+from app.utils.quantile_thresholds import QuantileThresholds
+from app.utils.frame_capture import FrameGrabber
+from app.utils.frame_sources import (
+    WebcamSource, open_frame_source, frame_source_spec, camera_settings, probe_capture, format_probe
+)
+from app.utils.roi_tracker import RoiTracker
+from app.utils.motion_gate import MotionGate
+from app.utils.frame_rate_scheduler import AdaptiveRateScheduler
+from app.utils.blendshape_vector import BlendshapeVector
+from app.utils.landmark_signals import LandmarkSignals
+from app.utils.frame_convert import RgbConverter
+from app.utils.low_light import LowLightEnhancer
+from app.utils.blendshape_recorder import BlendshapeRecorder
+from app.utils.gesture_bus import GestureBus
+from app.utils.tracing import span
 
 # --- Paths ---
 CONFIG_PATH = Path("cache/config.yaml")
-
-# --- Initialize Mediapipe face detector ---
-options = FaceLandmarkerOptions(
-    base_options=BaseOptions(model_asset_path="data/face_landmarker.task"),
-    running_mode=VisionRunningMode.IMAGE,
-    num_faces=1,
-    output_face_blendshapes=True
-)
-detector = FaceLandmarker.create_from_options(options)
-
-# --- Camera capture object ---
-cap = cv2.VideoCapture(0)
-
-# --- Global gesture detector instance ---
-gesture_detector = None
+MODEL_PATH = "data/face_landmarker.task"
 
 
 # -------------------------------------------------------------------
 # CONFIG / CLASS RELOAD MANAGEMENT
 # -------------------------------------------------------------------
-def load_config():
+def load_config(path=CONFIG_PATH):
     """Load thresholds safely from config.yaml."""
-    with open(CONFIG_PATH, "r") as f:
+    with open(path, "r") as f:
         data = yaml.safe_load(f)
     return data
 
 
-def reload_gesture_detector():
+def create_signal_extractor(cfg):
+    """LandmarkSignals configured from a loaded config.yaml dict."""
+    return LandmarkSignals(
+        ear_open=cfg.get("ear_open", 0.28),
+        ear_closed=cfg.get("ear_closed", 0.10),
+        gaze_gain=cfg.get("iris_gaze_gain", 2.5),
+        up_gain=cfg.get("iris_up_gain", 4.0),
+        up_offset=cfg.get("iris_up_offset", 0.0),
+    )
+
+
+def create_gesture_detector(cfg):
     """
-    Recreate the GestureDetector instance using the latest config.yaml.
-    Safe to call any time from other modules.
+    Gesture detector configured from a loaded config.yaml dict:
+    `detector_engine` "threshold" (GestureDetector) or "hmm" (HmmGestureDetector).
     """
-    global gesture_detector
-
-    cfg = load_config()
-    gesture_detector = GestureDetector(
+    thresholds = dict(
         closed_threshold=cfg["closed_threshold"],
         open_threshold=cfg["open_threshold"],
         gaze_enter_threshold=cfg["gaze_enter_threshold"],
         gaze_exit_threshold=cfg["gaze_exit_threshold"],
         gaze_up_enter_threshold=cfg["gaze_up_enter_threshold"],
         gaze_up_exit_threshold=cfg["gaze_up_exit_threshold"],
+        signal_filter=create_signal_filter(cfg),
+        duration_model=create_duration_model(cfg),
+    )
+    if str(cfg.get("detector_engine", "threshold")).lower() == "hmm":
+        if cfg.get("adaptive_thresholds", False):
+            print("[vision] adaptive_thresholds is ignored with detector_engine: hmm "
+                  "(the HMM adapts its own state means)")
+        return HmmGestureDetector(
+            lag=cfg.get("hmm_lag", 3),
+            adapt_rate=cfg.get("hmm_adapt_rate", 0.01),
+            **thresholds
+        )
+    threshold_tracker = None
+    if cfg.get("adaptive_thresholds", False):
+        threshold_tracker = QuantileThresholds(
+            window=cfg.get("adaptive_threshold_window", 300),
+            engaged_window=cfg.get("adaptive_threshold_engaged_window", 60),
+        )
+    return GestureDetector(threshold_tracker=threshold_tracker, **thresholds)
+
+
+def create_duration_model(cfg):
+    """The user's learned blink-duration model if `blink_duration_learning` is on."""
+    if not cfg.get("blink_duration_learning", False):
+        return None
+    return BlinkDurationModel.load(
+        cfg.get("blink_duration_model_path", "cache/blink_durations.json"),
+        max_fast=cfg.get("max_fast_blink_duration", 0.4),
+        max_slow=cfg.get("max_slow_blink_duration", 0.8),
     )
 
 
-# Load it once on module import
-reload_gesture_detector()
+def create_signal_filter(cfg):
+    """Filter factory for `signal_filter` in config.yaml (none, ema, one_euro, median3)."""
+    kind = str(cfg.get("signal_filter", "none")).lower()
+    if kind == "ema":
+        return make_filter_factory(kind, tau=cfg.get("filter_tau_ms", 50) / 1000)
+    if kind == "one_euro":
+        return make_filter_factory(
+            kind, min_cutoff=cfg.get("one_euro_min_cutoff", 3.0), beta=cfg.get("one_euro_beta", 0.5)
+        )
+    return make_filter_factory(kind)
 
 
 # -------------------------------------------------------------------
-# MAIN EVENT READER
+# VISION ENGINE
 # -------------------------------------------------------------------
-def get_gesture_frame():
-    """Returns detected event string or None."""
-    success, frame = cap.read()
-    if not success:
-        return None
+class VisionEngine:
+    """
+    Frame capture -> face landmarker -> GestureDetector for one camera.
 
-    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame_rgb)
-    result = detector.detect(mp_image)
-
-    event = None
-    if result.face_blendshapes:
-        blendshapes = result.face_blendshapes[0]
-        left_blink = next((b.score for b in blendshapes if b.category_name == "eyeBlinkLeft"), 0.0)
-        right_blink = next((b.score for b in blendshapes if b.category_name == "eyeBlinkRight"), 0.0)
-        eye_look_in_left = next((b.score for b in blendshapes if b.category_name == "eyeLookInLeft"), 0.0)
-        eye_look_out_left = next((b.score for b in blendshapes if b.category_name == "eyeLookOutLeft"), 0.0)
-        eye_look_in_right = next((b.score for b in blendshapes if b.category_name == "eyeLookInRight"), 0.0)
-        eye_look_out_right = next((b.score for b in blendshapes if b.category_name == "eyeLookOutRight"), 0.0)
-        eye_look_up_left = next((b.score for b in blendshapes if b.category_name == "eyeLookUpLeft"), 0.0)
-        eye_look_up_right = next((b.score for b in blendshapes if b.category_name == "eyeLookUpRight"), 0.0)
-
-        events = gesture_detector.update(
-            left_blink, right_blink,
-            eye_look_in_left, eye_look_out_right,
-            eye_look_in_right, eye_look_out_left,
-            eye_look_up_left, eye_look_up_right
-        )
+    After start(), a single gesture thread runs inference once per captured
+    frame and publishes events on `bus`; consumers subscribe instead of
+    driving inference themselves.
 
+    Construction is the expensive part (MediaPipe import, model load, camera
+    open); the time spent in each phase is kept in `timings`.
+    """
+
+    def __init__(self, config_path=CONFIG_PATH, bus=None, running_mode=None, source=None, record_path=None):
+        self.config_path = config_path
+        self.bus = bus if bus is not None else GestureBus()
+        self.timings = {}
+        self.camera_report = None
+        self.rgb_converter = RgbConverter()
+        self.frames_processed = 0
+        # Frames that ran the landmarker vs. repeats that reused its last result
+        self.frames_inferred = 0
+        self.frames_skipped = 0
+        self.face_present = False
+        self._thread = None
+        self._running = False
+
+        with self._timed("config"):
+            self.cfg = cfg = load_config(config_path)
+            self.gesture_detector = create_gesture_detector(cfg)
+
+        # "image"       -> blocking detector.detect() on the caller's thread
+        # "live_stream" -> detector.detect_async(), results arrive via callback
+        self.running_mode = running_mode or str(cfg.get("running_mode", "image")).lower()
+
+        # "blendshapes" -> the landmarker's blendshape head scores the gestures
+        # "landmarks"   -> eye aspect ratio / iris offset from the landmarks
+        #                  alone; the blendshape head is switched off
+        self.signal_mode = str(cfg.get("signal_mode", "blendshapes")).lower()
+
+        # --- Face ROI tracking (crop frames around the last known face) ---
+        self.roi_tracker = None
+        if cfg.get("roi_tracking", False):
+            self.roi_tracker = RoiTracker(
+                padding=cfg.get("roi_padding", 0.25),
+                refresh_interval=cfg.get("roi_refresh_frames", 30),
+            )
+
+        # --- Motion gating (skip inference while the eyes are static) ---
+        self.motion_gate = None
+        if cfg.get("motion_gating", False):
+            self.motion_gate = MotionGate(
+                threshold=cfg.get("motion_threshold", 3.0),
+                refresh_ms=cfg.get("motion_refresh_ms", 300),
+            )
+
+        # --- Low-light enhancement of the face region ---
+        self.low_light = None
+        if cfg.get("low_light", False):
+            self.low_light = LowLightEnhancer(
+                threshold=cfg.get("low_light_threshold", 60),
+                mode=str(cfg.get("low_light_mode", "gamma")).lower(),
+                target=cfg.get("low_light_target", 110),
+                clip_limit=cfg.get("clahe_clip_limit", 2.0),
+            )
+
+        # --- Adaptive frame rate (full rate only around gestures) ---
+        self.rate_scheduler = None
+        if cfg.get("adaptive_rate", False):
+            self.rate_scheduler = AdaptiveRateScheduler(
+                idle_fps=cfg.get("rate_idle_fps", 10),
+                absent_fps=cfg.get("rate_absent_fps", 4),
+                idle_after=cfg.get("rate_idle_after", 1.0),
+            )
+
+        self.signals = create_signal_extractor(cfg) if self.signal_mode == "landmarks" else BlendshapeVector()
+
+        # --- Optional blendshape stream recording (for offline replay) ---
+        # `record_path` > DRISHTI_RECORD > `record_path` in config.yaml
+        self.recorder = None
+        record_path = record_path or os.environ.get("DRISHTI_RECORD") or cfg.get("record_path")
+        if record_path:
+            self.recorder = BlendshapeRecorder(record_path)
+            atexit.register(self.recorder.close)
+
+        # timestamp_ms -> (sample timestamp, capture time, roi region) of
+        # frames handed to detect_async whose result hasn't arrived yet
+        self._in_flight = {}
+        # Last frame handed to detect_async and its timestamp (must strictly increase)
+        self._last_submitted_seq = 0
+        self._last_timestamp_ms = -1
+
+        with self._timed("mediapipe import"):
+            import mediapipe as mp
+            self.mp = mp
+
+        with self._timed("landmarker"):
+            self.detector = self._create_landmarker()
+
+        # --- Frame capture (producer thread, latest-frame slot) ---
+        # Backend from `source`, else DRISHTI_SOURCE or `frame_source` in
+        # config.yaml (default webcam:0)
+        with self._timed("camera"):
+            frame_source = open_frame_source(
+                source or frame_source_spec(cfg),
+                fps=cfg.get("frame_source_fps"),
+                loop=cfg.get("frame_source_loop", False),
+                backend_timestamps=cfg.get("timestamp_source", "capture") == "backend",
+                camera=camera_settings(cfg),
+            )
+        if cfg.get("camera_probe", False) and isinstance(frame_source, WebcamSource):
+            with self._timed("camera probe"):
+                self.camera_report = probe_capture(frame_source)
+            print("[vision] Camera: " + format_probe(self.camera_report))
+        self.cap = FrameGrabber(frame_source, hash_dedup=cfg.get("frame_hash_dedup", True))
+
+        print("[vision] Engine ready: " + ", ".join(
+            f"{phase} {seconds * 1000:.0f} ms" for phase, seconds in self.timings.items()
+        ))
+
+    @contextmanager
+    def _timed(self, phase):
+        start = perf_counter()
+        yield
+        self.timings[phase] = perf_counter() - start
+
+    def _create_landmarker(self):
+        vision = self.mp.tasks.vision
+        if self.running_mode == "live_stream":
+            # MediaPipe drops frames on its own while an earlier one is in flight
+            options = vision.FaceLandmarkerOptions(
+                base_options=self.mp.tasks.BaseOptions(model_asset_path=MODEL_PATH),
+                running_mode=vision.RunningMode.LIVE_STREAM,
+                num_faces=1,
+                output_face_blendshapes=self.signal_mode != "landmarks",
+                result_callback=self._on_live_result
+            )
+        else:
+            options = vision.FaceLandmarkerOptions(
+                base_options=self.mp.tasks.BaseOptions(model_asset_path=MODEL_PATH),
+                running_mode=vision.RunningMode.IMAGE,
+                num_faces=1,
+                output_face_blendshapes=self.signal_mode != "landmarks"
+            )
+        return vision.FaceLandmarker.create_from_options(options)
+
+    def reload_gesture_detector(self):
+        """Recreate the GestureDetector from the latest config.yaml."""
+        self._save_duration_model()
+        self.gesture_detector = create_gesture_detector(load_config(self.config_path))
+
+    # ---------------------------------------------------------------
+    # Result handling
+    # ---------------------------------------------------------------
+    def _events_from_result(self, result, timestamp, region):
+        """Feed the gesture scores of a landmarker result to the gesture detector."""
+        if self.signal_mode == "landmarks":
+            self.face_present = bool(result.face_landmarks)
+            if not self.face_present:
+                return []
+            (x0, y0, x1, y1), _ = region
+            scores = self.signals.fill(result.face_landmarks[0], aspect=(x1 - x0) / max(y1 - y0, 1))
+        else:
+            self.face_present = bool(result.face_blendshapes)
+            if not self.face_present:
+                return []
+            scores = self.signals.fill(result.face_blendshapes[0])
+        return self._update_detector(scores, timestamp)
+
+    def _update_detector(self, scores, timestamp):
+        if self.recorder is not None:
+            self.recorder.record(timestamp, scores)
+        with span("GestureDetector.update"):
+            return self.gesture_detector.update_scores(scores, timestamp)
+
+    def _publish(self, events, timestamp, captured_at):
+        # Ambiguous frames (several simultaneous gestures) are ignored
         if len(events) == 1:
-            event = events[0]
+            self.bus.publish(events[0], timestamp, perf_counter() - captured_at)
+
+    def _on_live_result(self, result, output_image, timestamp_ms):
+        """LIVE_STREAM result callback (runs on a MediaPipe thread)."""
+        in_flight = self._in_flight.pop(timestamp_ms, None)
+        # Frames MediaPipe dropped never get a callback; forget them
+        for stale in [t for t in list(self._in_flight) if t < timestamp_ms]:
+            self._in_flight.pop(stale, None)
+        if in_flight is None:
+            return
+        timestamp, captured_at, region = in_flight
+        self._track(result, region)
+
+        self.frames_processed += 1
+        self.frames_inferred += 1
+        self._publish(self._events_from_result(result, timestamp, region), timestamp, captured_at)
+
+    # ---------------------------------------------------------------
+    # Frame processing
+    # ---------------------------------------------------------------
+    @staticmethod
+    def sample_time(frame):
+        """
+        Timestamp gestures are timed with: backend time if any, else grab
+        time. Webcam backend time is on the grab-time base (see
+        WebcamSource.backend_timestamp), so the two can alternate.
+        """
+        return frame.pts if frame.pts is not None else frame.timestamp
 
-    return event
+    def _to_mp_image(self, frame):
+        """
+        Convert a captured frame (cropped to the tracked face if enabled).
+        Returns (mp_image, (region, frame_shape)) where region is the part of
+        the frame the landmarks will be relative to.
+        """
+        if self.roi_tracker is None:
+            h, w = frame.image.shape[:2]
+            image, region = frame.image, (0, 0, w, h)
+        else:
+            image, region = self.roi_tracker.crop(frame.image)
+        region = (region, frame.image.shape)
+
+        with span("cvtColor", seq=frame.seq):
+            frame_rgb = self.rgb_converter.convert(image)
+        if self.low_light is not None:
+            with span("low_light", seq=frame.seq):
+                self.low_light.process(frame_rgb, region[0])
+        return self.mp.Image(image_format=self.mp.ImageFormat.SRGB, data=frame_rgb), region
+
+    def _submit_live(self, frame):
+        """Hand a frame to the LIVE_STREAM landmarker with a monotonic timestamp."""
+        if frame.seq == self._last_submitted_seq:
+            return
+        timestamp = self.sample_time(frame)
+        timestamp_ms = max(int(timestamp * 1000), self._last_timestamp_ms + 1)
+        self._last_submitted_seq = frame.seq
+        self._last_timestamp_ms = timestamp_ms
+
+        mp_image, region = self._to_mp_image(frame)
+        self._in_flight[timestamp_ms] = (timestamp, frame.timestamp, region)
+        if self.motion_gate is not None:
+            self.motion_gate.mark_inferred(frame.image, timestamp)
+        with span("detector.detect_async", seq=frame.seq):
+            self.detector.detect_async(mp_image, timestamp_ms)
+
+    def process_frame(self, frame):
+        """Run IMAGE-mode inference on one frame; returns the detector's events."""
+        mp_image, region = self._to_mp_image(frame)
+        with span("detector.detect", seq=frame.seq):
+            result = self.detector.detect(mp_image)
+        self._track(result, region)
+        if self.motion_gate is not None:
+            self.motion_gate.mark_inferred(frame.image, self.sample_time(frame))
+
+        self.frames_processed += 1
+        self.frames_inferred += 1
+        return self._events_from_result(result, self.sample_time(frame), region)
+
+    def _track(self, result, region):
+        """Follow the face/eyes found in `result` for the next frame's crop and gate."""
+        if self.roi_tracker is not None:
+            self.roi_tracker.update(result, *region)
+        if self.motion_gate is not None:
+            self.motion_gate.track(result, *region)
+        if self.low_light is not None:
+            self.low_light.track(result, *region)
+
+    def _needs_inference(self, frame):
+        if frame.duplicate:
+            return False
+        if self.rate_scheduler is not None and not self.rate_scheduler.should_sample(
+            self.sample_time(frame), self.gesture_detector, self.face_present, self.signals.scores
+        ):
+            return False
+        if self.motion_gate is None:
+            return True
+        return self.motion_gate.should_infer(frame.image, self.sample_time(frame))
+
+    def reuse_last_result(self, frame):
+        """Feed the previous score vector again for a repeated or static frame."""
+        self.frames_processed += 1
+        self.frames_skipped += 1
+        if not self.face_present:
+            return []
+        return self._update_detector(self.signals.scores, self.sample_time(frame))
+
+    def stats(self):
+        """Frame counters, e.g. to measure what duplicate skipping saves."""
+        return {
+            "processed": self.frames_processed,
+            "inferred": self.frames_inferred,
+            "skipped": self.frames_skipped,
+            "dropped": self.cap.dropped,
+            "duplicates": self.cap.duplicates,
+            "static": self.motion_gate.skipped if self.motion_gate is not None else 0,
+            "rate_skipped": self.rate_scheduler.skipped if self.rate_scheduler is not None else 0,
+            "enhanced": self.low_light.enhanced if self.low_light is not None else 0,
+        }
+
+    # ---------------------------------------------------------------
+    # Gesture thread
+    # ---------------------------------------------------------------
+    def start(self):
+        """Start the gesture thread (once)."""
+        if self._thread is None:
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="drishti-gesture", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        last_seq = 0
+        while self._running:
+            frame = self.cap.wait_next(last_seq, timeout=0.5)
+            if frame is None:
+                if not self.cap.running:
+                    break
+                continue
+            last_seq = frame.seq
+
+            if self.running_mode == "live_stream":
+                if self._needs_inference(frame):
+                    self._submit_live(frame)
+                else:
+                    # Detector state lives on the callback thread; just skip
+                    self.frames_skipped += 1
+                continue
+
+            events = self.handle_frame(frame)
+            self._publish(events, self.sample_time(frame), frame.timestamp)
+
+    def handle_frame(self, frame):
+        """One IMAGE-mode step: infer (or reuse the last result) and update the detector."""
+        if self._needs_inference(frame):
+            return self.process_frame(frame)
+        return self.reuse_last_result(frame)
+
+    @property
+    def running(self):
+        return self._running and self.cap.running
+
+    def _save_duration_model(self):
+        model = self.gesture_detector.duration_model
+        if model is not None and model.path is not None:
+            model.save()
+
+    def release(self):
+        self._running = False
+        self.cap.release()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self.detector.close()
+        self._save_duration_model()
+
+
+# -------------------------------------------------------------------
+# SHARED ENGINE (lazy, optionally warmed up in the background)
+# -------------------------------------------------------------------
+_engine = None
+_engine_lock = threading.Lock()
+_warm_up_thread = None
+_warm_up_error = None  # why the last background build failed, for get_engine()
+
+# Subscribers can attach before the engine exists; it publishes here once up
+gesture_bus = GestureBus()
+
+
+def get_engine():
+    """
+    The shared VisionEngine, built and started on first use. With
+    `vision_process: true` in config.yaml the pipeline runs in a worker
+    process instead (see app/core/vision_worker.py). Re-raises the error of
+    a failed background warm-up once; the call after that tries again.
+    """
+    global _engine, _warm_up_error
+    if _warm_up_error is not None:
+        error, _warm_up_error = _warm_up_error, None
+        raise error
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                if load_config().get("vision_process", False):
+                    from app.core.vision_worker import RemoteVisionEngine
+                    engine = RemoteVisionEngine(bus=gesture_bus)
+                else:
+                    engine = VisionEngine(bus=gesture_bus)
+                engine.start()
+                _engine = engine
+                # Backstop for exits that skip the UI's shutdown path
+                atexit.register(release_camera)
+    return _engine
+
+
+def _warm_up():
+    global _warm_up_thread, _warm_up_error
+    _warm_up_error = None  # this build is the retry
+    try:
+        get_engine()
+    except Exception as e:
+        _warm_up_error = e
+        print(f"[vision] Engine failed to start: {e}")
+    finally:
+        # Lets a later warm_up_async() (e.g. the next subscriber) retry
+        _warm_up_thread = None
+
+
+def warm_up_async():
+    """Start building the shared engine on a background thread."""
+    global _warm_up_thread
+    thread = _warm_up_thread
+    if _engine is None and thread is None:
+        thread = _warm_up_thread = threading.Thread(target=_warm_up, name="drishti-vision-warmup", daemon=True)
+        thread.start()
+    return thread
+
+
+def reload_gesture_detector():
+    """
+    Recreate the GestureDetector instance using the latest config.yaml.
+    Safe to call any time from other modules.
+    """
+    if _engine is not None:
+        _engine.reload_gesture_detector()
+
+
+# -------------------------------------------------------------------
+# MAIN EVENT READER
+# -------------------------------------------------------------------
+def subscribe_gestures(maxsize=64):
+    """
+    Subscribe to the shared gesture stream (starting the engine in the
+    background if needed). Each window should hold its own subscription.
+    """
+    subscription = gesture_bus.subscribe(maxsize)
+    warm_up_async()
+    return subscription
+
+
+_default_subscription = None
+
+
+def get_gesture_frame():
+    """Returns detected event string or None. Never waits on the camera."""
+    global _default_subscription
+    if _default_subscription is None:
+        _default_subscription = subscribe_gestures()
+    return _default_subscription.poll()
 
 
 def release_camera():
-    cap.release()
+    """Stop the shared engine (and its worker process), saving its files. Safe to call twice."""
+    global _engine
+    with _engine_lock:
+        engine, _engine = _engine, None
+    if engine is not None:
+        engine.release()
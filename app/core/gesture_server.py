@@ -0,0 +1,256 @@
+"""
+Headless gesture daemon: runs the vision pipeline and DataProvider once, with
+no Tk, and streams their state to any number of local clients as JSON lines.
+
+    python -m app.core.gesture_server                      # Unix socket cache/drishti.sock
+    python -m app.core.gesture_server --tcp 127.0.0.1:8765  # loopback TCP
+
+Server -> client messages (one JSON object per line):
+    {"type": "gesture", "name": "FB", "timestamp": 12.34, "latency": 0.041}
+    {"type": "state", "level": 0, "buffer": ".-", "written": "HELLO ",
+     "suggestions": [...], "suggestion_type": "prefix", "selected": 0}
+Client -> server commands:
+    {"cmd": "gesture", "name": "SB"}   inject a gesture (tests, caregiver tablet)
+    {"cmd": "reload"}                  re-read thresholds from config.yaml
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import queue
+import socket
+import threading
+from pathlib import Path
+
+SOCKET_PATH = Path("cache/drishti.sock")
+DEFAULT_TCP_HOST = "127.0.0.1"
+CLIENT_QUEUE_SIZE = 256  # messages buffered per client before the oldest are dropped
+TICK = 1 / 60            # seconds between DataProvider updates
+
+
+def encode(message):
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+
+# -------------------------------------------------------------------
+# SERVER
+# -------------------------------------------------------------------
+class GestureServer:
+    """Owns the one DataProvider and fans its output out to connected clients."""
+
+    def __init__(self, provider=None, gestures=None):
+        import app.utils.global_state as gs
+        gs.headless = True
+
+        if provider is None:
+            from app.core.eye_gesture import subscribe_gestures
+            from app.core.morse_based_typing import DataProvider
+
+            gestures = subscribe_gestures()
+            provider = DataProvider(event_source=self._next_event)
+        self.gestures = gestures
+        self.provider = provider
+
+        self.clients = set()
+        self._injected = queue.Queue()
+        self._pending = []  # gesture messages produced by the last update
+        self._last_state = None
+
+    # --- pipeline side (runs in the executor thread) ---
+    def _next_event(self):
+        """DataProvider's event source: injected gestures first, then the camera."""
+        try:
+            name = self._injected.get_nowait()
+            self._pending.append({"type": "gesture", "name": name, "timestamp": None, "latency": None})
+            return name
+        except queue.Empty:
+            pass
+        event = self.gestures.poll_event() if self.gestures is not None else None
+        if event is None:
+            return None
+        self._pending.append({
+            "type": "gesture", "name": event.name, "timestamp": event.timestamp, "latency": event.latency,
+        })
+        return event.name
+
+    def state(self):
+        p = self.provider
+        return {
+            "type": "state",
+            "level": p.current_level,
+            "buffer": p.buffer,
+            "written": p.written_string,
+            "suggestions": list(p.current_suggestion["suggestion"]),
+            "suggestion_type": p.current_suggestion["type"],
+            "selected": p.selected_suggestion_index,
+        }
+
+    def _update(self):
+        """One DataProvider step; returns the messages to broadcast."""
+        self._pending = []
+        self.provider.update_all()
+        messages = self._pending
+        state = self.state()
+        if state != self._last_state:
+            self._last_state = state
+            messages.append(state)
+        return messages
+
+    # --- asyncio side ---
+    def broadcast(self, message):
+        for client in self.clients:
+            if client.full():
+                client.get_nowait()
+            client.put_nowait(message)
+
+    async def _pump(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # update_all may block on speech or the sentence API; keep it off the loop
+            for message in await loop.run_in_executor(None, self._update):
+                self.broadcast(message)
+            await asyncio.sleep(TICK)
+
+    async def _send_loop(self, outbox, writer):
+        try:
+            while True:
+                message = await outbox.get()
+                writer.write(encode(message))
+                await writer.drain()
+        except ConnectionError:
+            # Peer reset mid-write: stop queueing for it and end its reader
+            self.clients.discard(outbox)
+            writer.close()
+
+    def _handle_command(self, line):
+        try:
+            command = json.loads(line)
+        except json.JSONDecodeError:
+            return
+        if command.get("cmd") == "gesture" and command.get("name"):
+            self._injected.put(str(command["name"]))
+        elif command.get("cmd") == "reload":
+            from app.core.eye_gesture import reload_gesture_detector
+            reload_gesture_detector()
+
+    async def _serve_client(self, reader, writer):
+        outbox = asyncio.Queue(CLIENT_QUEUE_SIZE)
+        outbox.put_nowait(self._last_state or self.state())
+        self.clients.add(outbox)
+        sender = asyncio.create_task(self._send_loop(outbox, writer))
+        print(f"[server] Client connected ({len(self.clients)} total)")
+        try:
+            while line := await reader.readline():
+                self._handle_command(line)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.clients.discard(outbox)
+            sender.cancel()
+            writer.close()
+            print(f"[server] Client disconnected ({len(self.clients)} total)")
+            # Surfaces anything the sender died of other than the cancel
+            with contextlib.suppress(asyncio.CancelledError):
+                await sender
+
+    async def serve(self, path=SOCKET_PATH, tcp=None):
+        """Serve until cancelled, on `tcp` (host, port) or else the Unix socket `path`."""
+        if tcp is not None:
+            server = await asyncio.start_server(self._serve_client, *tcp)
+            print(f"[server] Listening on {tcp[0]}:{tcp[1]}")
+        else:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if path.exists():
+                path.unlink()
+            server = await asyncio.start_unix_server(self._serve_client, str(path))
+            print(f"[server] Listening on {path}")
+
+        async with server:
+            await asyncio.gather(server.serve_forever(), self._pump())
+
+
+# -------------------------------------------------------------------
+# THIN CLIENT
+# -------------------------------------------------------------------
+class GestureClient:
+    """
+    Blocking client for Tk UIs and tests. A reader thread keeps `state`
+    current and queues gesture names for poll(), the same interface as a
+    local gesture Subscription.
+    """
+
+    def __init__(self, path=SOCKET_PATH, tcp=None, timeout=5.0):
+        if tcp is not None:
+            self.sock = socket.create_connection(tcp, timeout=timeout)
+        else:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(timeout)
+            self.sock.connect(str(path))
+        self.sock.settimeout(None)
+
+        self.state = {}
+        self.events = queue.Queue()
+        self._send_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="drishti-client", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        with self.sock.makefile("rb") as lines:
+            for line in lines:
+                message = json.loads(line)
+                if message["type"] == "state":
+                    self.state = message
+                elif message["type"] == "gesture":
+                    self.events.put(message)
+
+    def poll(self):
+        """Next gesture name or None. Never blocks."""
+        try:
+            return self.events.get_nowait()["name"]
+        except queue.Empty:
+            return None
+
+    def _send(self, message):
+        with self._send_lock:
+            self.sock.sendall(encode(message))
+
+    def send_gesture(self, name):
+        self._send({"cmd": "gesture", "name": name})
+
+    def reload(self):
+        self._send({"cmd": "reload"})
+
+    def close(self):
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+
+def parse_tcp(value):
+    host, _, port = value.rpartition(":")
+    return host or DEFAULT_TCP_HOST, int(port)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--socket", default=os.environ.get("DRISHTI_SOCKET", str(SOCKET_PATH)),
+                        help="Unix socket path")
+    parser.add_argument("--tcp", type=parse_tcp, default=None, help="serve on host:port instead (loopback)")
+    args = parser.parse_args()
+
+    from app.core.eye_gesture import get_engine, release_camera
+    get_engine()
+    try:
+        asyncio.run(GestureServer().serve(args.socket, args.tcp))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        release_camera()
+
+
+if __name__ == "__main__":
+    main()
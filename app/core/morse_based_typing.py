@@ -1,11 +1,24 @@
-from app.core.eye_gesture import get_gesture_frame
+from app.core.eye_gesture import subscribe_gestures
 from app.utils.morse_decoder import event_to_letter
-from app.utils.text_suggestion import suggest, update_user_cache
+from app.utils.text_suggestion import suggest, update_user_cache, CACHE_FILE
 from app.utils.speech import speak
 from app.utils.sentence_suggestion import suggest_sentences
+from app.utils.tracing import span
 
 class DataProvider:
-    def __init__(self):
+    def __init__(self, event_source=None, user_cache=None, user_cache_file=CACHE_FILE, speaker=speak):
+        # Callable returning the next gesture event or None (camera by default)
+        if event_source is None:
+            self.gestures = subscribe_gestures()
+            event_source = self.gestures.poll
+        self.event_source = event_source
+        # Callable that says a text aloud (blocking TTS by default)
+        self.speak = speaker
+
+        # Personalised word cache (None -> the default user's)
+        self.user_cache = user_cache
+        self.user_cache_file = user_cache_file
+
         self.current_level = 0
         self.blink_count = 0
         self.buffer = ""
@@ -18,11 +31,12 @@ class DataProvider:
 
     def update_selection(self, event):
         self.buffer, self.written_string = event_to_letter(
-            event, self.buffer, self.written_string
+            event, self.buffer, self.written_string, say=self.speak
         )
 
     def update_suggestions(self):
-        prefix_sugg, context_sugg = suggest(self.written_string)
+        with span("suggest"):
+            prefix_sugg, context_sugg = suggest(self.written_string, cache=self.user_cache)
         self.current_suggestion["suggestion"] = prefix_sugg or context_sugg
         self.current_suggestion["type"] = "context" if context_sugg else "prefix" if prefix_sugg else "none"
         while len(self.current_suggestion["suggestion"]) < 4:
@@ -55,22 +69,24 @@ class DataProvider:
                     self.written_string = " ".join(words) + " "  # add space after suggestion
 
                     # Update cache
-                    update_user_cache(words[-1], self.current_suggestion['suggestion'][self.selected_suggestion_index])
+                    update_user_cache(words[-1], self.current_suggestion['suggestion'][self.selected_suggestion_index],
+                                      cache=self.user_cache, cache_file=self.user_cache_file)
                 elif self.current_suggestion["type"] == "context":
                     words = self.written_string.split()
                     self.written_string += f"{self.current_suggestion['suggestion'][self.selected_suggestion_index]} "
-                    update_user_cache((words[-2], words[-1]), self.current_suggestion['suggestion'][self.selected_suggestion_index])
+                    update_user_cache((words[-2], words[-1]), self.current_suggestion['suggestion'][self.selected_suggestion_index],
+                                      cache=self.user_cache, cache_file=self.user_cache_file)
             else:
                 self.written_string = self.current_suggestion["suggestion"][self.selected_suggestion_index]
 
     def update_all(self):
-        event = get_gesture_frame()
+        event = self.event_source()
         self.update_suggestions()
         if event:
             if event == "FU":
                 self.current_level = (self.current_level + 1) % 2
             elif event == "FR":
-                speak(self.written_string)
+                self.speak(self.written_string)
 
             if self.current_level == 0:
                 self.selected_suggestion_index = 0
@@ -0,0 +1,227 @@
+"""
+Ward mode: several patients' camera pipelines in one service.
+
+Each PatientSession owns an independent capture -> landmarker ->
+GestureDetector -> DataProvider pipeline, with its own config.yaml, gesture
+bus, user word cache, blink-duration model and recording under
+cache/sessions/<session_id>/. The SessionManager drives them from a small pool
+of worker threads; every time a worker is free it serves the ready session
+that has been stepped for the least wall time so far, so one busy patient
+can't starve the others.
+
+Sessions run headless: steps happen on worker threads, so the Morse "chat"
+command is skipped and speech goes through the manager's one SpeechQueue.
+"""
+import os
+import threading
+from pathlib import Path
+from time import perf_counter
+
+import yaml
+
+from app.core.eye_gesture import CONFIG_PATH, VisionEngine, load_config
+from app.utils.gesture_bus import GestureBus
+
+SESSIONS_DIR = Path("cache/sessions")
+
+
+def localize_paths(cfg, directory):
+    """Point the files a pipeline writes (duration model, recording) into `directory`."""
+    directory = Path(directory)
+    cfg["blink_duration_model_path"] = str(directory / "blink_durations.json")
+    if cfg.get("record_path") or os.environ.get("DRISHTI_RECORD"):
+        cfg["record_path"] = str(directory / "recording.npy")
+    return cfg
+
+
+# -------------------------------------------------------------------
+# ONE PATIENT
+# -------------------------------------------------------------------
+class PatientSession:
+    """A single patient's pipeline. Not started on its own; the manager steps it."""
+
+    def __init__(self, session_id, source=None, sessions_dir=SESSIONS_DIR, typing=True, speaker=None):
+        self.session_id = session_id
+        self.directory = Path(sessions_dir) / session_id
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Per-session config, seeded from the default one with its output
+        # files moved into the session directory
+        self.config_path = self.directory / "config.yaml"
+        if not self.config_path.exists():
+            with open(self.config_path, "w") as f:
+                yaml.safe_dump(localize_paths(load_config(CONFIG_PATH), self.directory), f, sort_keys=False)
+
+        self.bus = GestureBus()
+        self.engine = VisionEngine(
+            self.config_path, bus=self.bus, running_mode="image", source=source,
+            record_path=load_config(self.config_path).get("record_path"),
+        )
+
+        # Morse typing state; optional so the vision side can run on its own
+        self.typing = None
+        if typing:
+            from app.core.morse_based_typing import DataProvider
+            from app.utils.text_suggestion import load_user_cache
+
+            cache_file = str(self.directory / "user_cache.json")
+            self.gestures = self.bus.subscribe()
+            self.typing = DataProvider(
+                event_source=self.gestures.poll,
+                user_cache=load_user_cache(cache_file),
+                user_cache_file=cache_file,
+                speaker=speaker,
+            )
+
+        self.last_seq = 0
+        # Scheduler's fairness key: wall time, since most of a step is spent
+        # on MediaPipe's own threads where thread CPU time can't see it
+        self.busy_time = 0.0
+        self.frames = 0
+        self._busy = False
+
+    def ready(self):
+        """True if a frame newer than the last one served is waiting."""
+        if self._busy:
+            return False
+        frame = self.engine.cap.latest()
+        return frame is not None and frame.seq != self.last_seq
+
+    def step(self):
+        """Process the newest frame. Returns the seconds spent."""
+        frame = self.engine.cap.latest()
+        if frame is None or frame.seq == self.last_seq:
+            return 0.0
+        self.last_seq = frame.seq
+
+        start = perf_counter()
+        events = self.engine.handle_frame(frame)
+        self.engine._publish(events, self.engine.sample_time(frame), frame.timestamp)
+        if self.typing is not None:
+            self.typing.update_all()
+        self.frames += 1
+        return perf_counter() - start
+
+    def reload_config(self):
+        self.engine.reload_gesture_detector()
+
+    @property
+    def running(self):
+        return self.engine.cap.running
+
+    def release(self):
+        self.engine.release()
+
+
+# -------------------------------------------------------------------
+# SCHEDULER
+# -------------------------------------------------------------------
+class SessionManager:
+    """Owns the ward's sessions and shares `workers` threads fairly between them."""
+
+    IDLE_WAIT = 0.005  # seconds a worker sleeps when no session has a new frame
+
+    def __init__(self, workers=None, sessions_dir=SESSIONS_DIR):
+        import app.utils.global_state as gs
+        gs.headless = True
+
+        self.speech = None  # shared by the typing sessions, made with the first
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.sessions_dir = Path(sessions_dir)
+        self.sessions = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._threads = []
+        self._running = False
+        self.started_at = None
+
+    # --- session lifecycle ---
+    def add_session(self, session_id, source=None, typing=True):
+        if session_id in self.sessions:
+            raise ValueError(f"Session {session_id!r} already exists")
+        if typing and self.speech is None:
+            from app.utils.speech import SpeechQueue
+            self.speech = SpeechQueue()
+        session = PatientSession(
+            session_id, source=source, sessions_dir=self.sessions_dir, typing=typing,
+            speaker=self.speech.say if typing else None,
+        )
+        with self._lock:
+            # Join at the current minimum so a newcomer doesn't get a burst
+            # of catch-up time at everyone else's expense
+            if self.sessions:
+                session.busy_time = min(s.busy_time for s in self.sessions.values())
+            self.sessions[session_id] = session
+        print(f"[ward] Session {session_id} started ({len(self.sessions)} active)")
+        return session
+
+    def remove_session(self, session_id):
+        with self._lock:
+            session = self.sessions.pop(session_id, None)
+            while session is not None and session._busy:
+                self._wake.wait(0.1)
+        if session is not None:
+            session.release()
+            print(f"[ward] Session {session_id} stopped ({len(self.sessions)} active)")
+
+    # --- scheduling ---
+    def _next_session(self):
+        """Ready session with the least time used so far (caller holds the lock)."""
+        ready = [s for s in self.sessions.values() if s.ready()]
+        if not ready:
+            return None
+        return min(ready, key=lambda s: s.busy_time)
+
+    def _worker(self):
+        while self._running:
+            with self._lock:
+                session = self._next_session()
+                if session is None:
+                    self._wake.wait(self.IDLE_WAIT)
+                    continue
+                session._busy = True
+
+            try:
+                spent = session.step()
+            except Exception as e:
+                print(f"[ward] Session {session.session_id} step failed: {e}")
+                spent = 0.0
+
+            with self._lock:
+                session.busy_time += spent
+                session._busy = False
+                self._wake.notify_all()
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self.started_at = perf_counter()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"drishti-ward-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stats(self):
+        """Per-session frames, fps since start, busy seconds and engine counters."""
+        elapsed = perf_counter() - self.started_at if self.started_at else 0.0
+        return {
+            session_id: dict(
+                frames=session.frames,
+                fps=session.frames / elapsed if elapsed else 0.0,
+                busy=session.busy_time,
+                **session.engine.stats(),
+            )
+            for session_id, session in list(self.sessions.items())
+        }
+
+    def stop(self):
+        self._running = False
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        self._threads = []
+        for session_id in list(self.sessions):
+            self.remove_session(session_id)
+        if self.speech is not None:
+            self.speech.close()
+            self.speech = None
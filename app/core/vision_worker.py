@@ -0,0 +1,162 @@
+"""
+Optional out-of-process vision pipeline (`vision_process: true` in config.yaml).
+
+The worker process owns capture and the FaceLandmarker, so inference gets its
+own interpreter and GIL. Frames never leave the worker; only the small
+per-frame blendshape vector and the gesture events come back through a pipe.
+"""
+import multiprocessing
+import threading
+from time import perf_counter
+
+from app.core.eye_gesture import CONFIG_PATH, VisionEngine
+from app.utils import tracing
+from app.utils.gesture_bus import GestureBus
+
+STATS_EVERY = 30  # frames between stats messages
+
+
+# -------------------------------------------------------------------
+# WORKER PROCESS
+# -------------------------------------------------------------------
+def run_worker(config_path, conn):
+    """Entry point of the vision process."""
+    # Results must come back in frame order, so the worker always runs the
+    # landmarker synchronously
+    try:
+        engine = VisionEngine(config_path, bus=GestureBus(), running_mode="image")
+    except Exception as exc:
+        conn.send(("error", f"{type(exc).__name__}: {exc}"))
+        return
+    conn.send(("ready", engine.timings))
+
+    last_seq = 0
+    try:
+        while True:
+            while conn.poll():
+                command = conn.recv()
+                if command == "stop":
+                    return
+                if command == "reload":
+                    engine.reload_gesture_detector()
+
+            frame = engine.cap.wait_next(last_seq, timeout=0.1)
+            if frame is None:
+                if not engine.cap.running:
+                    return
+                continue
+            last_seq = frame.seq
+
+            events = engine.handle_frame(frame)
+            scores = engine.signals.scores.tolist() if engine.face_present else None
+            conn.send((
+                "sample", frame.seq, engine.sample_time(frame), frame.timestamp, scores, events
+            ))
+            if frame.seq % STATS_EVERY == 0:
+                conn.send(("stats", engine.stats()))
+    except (EOFError, BrokenPipeError):
+        pass
+    finally:
+        engine.release()
+        # multiprocessing children exit without running atexit handlers
+        if engine.recorder is not None:
+            engine.recorder.close()
+        if tracing.enabled:
+            path = tracing.trace_path
+            tracing.dump_trace(path.with_name(f"{path.stem}.worker{path.suffix}"))
+
+
+# -------------------------------------------------------------------
+# UI-PROCESS PROXY
+# -------------------------------------------------------------------
+class RemoteVisionEngine:
+    """
+    Stands in for VisionEngine in the UI process: starts the worker, and a
+    reader thread republishes its events on `bus`.
+    """
+
+    READY_TIMEOUT = 60.0
+    STOP_TIMEOUT = 5.0  # time the worker gets to save its files after "stop"
+
+    def __init__(self, config_path=CONFIG_PATH, bus=None):
+        self.bus = bus if bus is not None else GestureBus()
+        self.frames_processed = 0
+        self._stats = {}
+        self._send_lock = threading.Lock()
+        self._thread = None
+        self._running = False
+
+        start = perf_counter()
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=run_worker, args=(str(config_path), child_conn),
+            name="drishti-vision", daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+        # "ready" follows the engine build, before any frame; a worker that
+        # dies first closes the pipe, which also ends the wait
+        if not self._conn.poll(self.READY_TIMEOUT):
+            self.process.terminate()
+            raise RuntimeError("Vision worker did not start")
+        try:
+            message = self._conn.recv()
+        except EOFError:
+            self.process.join(timeout=2.0)
+            message = ("error", f"exited with code {self.process.exitcode}")
+        if message[0] == "error":
+            self.process.join(timeout=2.0)
+            self._conn.close()
+            raise RuntimeError(f"Vision worker failed to start: {message[1]}")
+        _, timings = message
+        self.timings = dict(timings, worker=perf_counter() - start)
+        print(f"[vision] Worker process {self.process.pid} ready in {self.timings['worker'] * 1000:.0f} ms")
+
+    def _send(self, message):
+        with self._send_lock:
+            self._conn.send(message)
+
+    def start(self):
+        if self._thread is None:
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="drishti-vision-reader", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while self._running:
+            try:
+                message = self._conn.recv()
+            except (EOFError, OSError):
+                break
+
+            if message[0] == "sample":
+                _, seq, timestamp, captured_at, scores, events = message
+                self.frames_processed += 1
+                if len(events) == 1:
+                    self.bus.publish(events[0], timestamp, perf_counter() - captured_at)
+            elif message[0] == "stats":
+                self._stats = message[1]
+
+    def reload_gesture_detector(self):
+        self._send("reload")
+
+    def stats(self):
+        return dict(self._stats, received=self.frames_processed)
+
+    @property
+    def running(self):
+        return self._running and self.process.is_alive()
+
+    def release(self):
+        self._running = False
+        try:
+            self._send("stop")
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=self.STOP_TIMEOUT)
+        if self.process.is_alive():
+            print("[vision] Worker did not stop in time; terminating it")
+            self.process.terminate()
+        self._conn.close()
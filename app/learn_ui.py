@@ -3,7 +3,7 @@ from io import BytesIO
 import threading
 import tkinter as tk
 import pygame
-from app.core.eye_gesture import get_gesture_frame
+from app.core.eye_gesture import subscribe_gestures
 
 # -----------------------------
 # Morse dictionary
@@ -114,6 +114,7 @@ class GuidedMorseLearner(tk.Toplevel):
         self.pattern_widgets = []
         self.instruction_spoken = False
         self.level_completion_spoken = False
+        self.gestures = subscribe_gestures()
 
         # Build UI
         self._build_ui()
@@ -229,6 +230,8 @@ class GuidedMorseLearner(tk.Toplevel):
                 self.current_symbol = "ENTER"
 
         self.awaiting_input = True
+        # Gestures made before this prompt don't count
+        self.gestures.clear()
 
         # Highlight waiting symbol
         self._highlight_control(self.current_symbol, HIGHLIGHT)
@@ -266,7 +269,7 @@ class GuidedMorseLearner(tk.Toplevel):
             self.after(40, self._poll_gesture)
             return
         try:
-            event = get_gesture_frame()
+            event = self.gestures.poll()
             if event:
                 mapped = GESTURE_TO_SYMBOL.get(event)
                 if mapped == self.current_symbol:
@@ -296,6 +299,10 @@ class GuidedMorseLearner(tk.Toplevel):
 
         self.after(40, self._poll_gesture)
 
+    def destroy(self):
+        self.gestures.close()
+        super().destroy()
+
     # --------------------------
     # Move to next symbol
     # --------------------------
@@ -1,10 +1,9 @@
 import tkinter as tk
 from app.core.morse_based_typing import DataProvider
+from app.utils.tracing import span
 import time
 import statistics
 
-datas_obj = DataProvider()
-
 class DrishtiKeyboardUI(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -13,6 +12,10 @@ class DrishtiKeyboardUI(tk.Tk):
         self.geometry("1150x700")
         self.minsize(900, 600)
 
+        # Subscribe to gestures only now, so blinks made during calibration
+        # and learning aren't replayed into the keyboard
+        self.datas = DataProvider()
+
         # Theme colors
         self.bg_color = "#121212"
         self.key_color = "#1e1e1e"
@@ -116,24 +119,27 @@ class DrishtiKeyboardUI(tk.Tk):
         gs.main_ui = self
 
     def fast_loop(self):
-        datas_obj.update_all()
-        self.input_var.set(f'"{datas_obj.written_string}"')
-        buffer_string = datas_obj.buffer.replace('.', '●').replace('-', '▬')
-        self.buffer_var.set(buffer_string)
-
-        for i in range(4):
-            self.word_labels[i].config(text=datas_obj.current_suggestion["suggestion"][i],
-                                       bg=self.key_color)
-
-        for i in range(2):
-            self.sentence_labels[i].config(text=datas_obj.current_suggestion["suggestion"][i + 4],
-                                       bg=self.key_color)
-
-        if datas_obj.current_level == 1:
-            if datas_obj.selected_suggestion_index < 4:
-                self.word_labels[datas_obj.selected_suggestion_index].config(bg="dark blue")
-            else:
-                self.sentence_labels[datas_obj.selected_suggestion_index - 4].config(bg="dark blue")
+        with span("DataProvider.update_all"):
+            self.datas.update_all()
+
+        with span("tk.update_widgets"):
+            self.input_var.set(f'"{self.datas.written_string}"')
+            buffer_string = self.datas.buffer.replace('.', '●').replace('-', '▬')
+            self.buffer_var.set(buffer_string)
+
+            for i in range(4):
+                self.word_labels[i].config(text=self.datas.current_suggestion["suggestion"][i],
+                                           bg=self.key_color)
+
+            for i in range(2):
+                self.sentence_labels[i].config(text=self.datas.current_suggestion["suggestion"][i + 4],
+                                           bg=self.key_color)
+
+            if self.datas.current_level == 1:
+                if self.datas.selected_suggestion_index < 4:
+                    self.word_labels[self.datas.selected_suggestion_index].config(bg="dark blue")
+                else:
+                    self.sentence_labels[self.datas.selected_suggestion_index - 4].config(bg="dark blue")
 
         # --- Added metric tracking ---
         self.metrics_logger.update(self.input_var.get())
@@ -0,0 +1,133 @@
+"""
+Vectorized GestureDetector for offline evaluation of recorded traces.
+
+detect_batch() gives exactly the (timestamp, event) list that replaying the
+same arrays through GestureDetector.update_scores() would, but computes it
+with whole-array NumPy operations:
+
+  * blinks and up-gaze are plain hysteresis: the state at each sample is
+    whichever of "above enter" / "below exit" happened last, found with a
+    running maximum over sample indices; onsets and offsets pair up in order,
+    so segment durations are a single subtraction.
+  * horizontal gaze skips samples in the neutral zone; on the rest, "looking
+    left" is hysteresis on the left score, and "looking right" is hysteresis
+    on the right score whose onsets are masked while looking left.
+
+The reductions need each enter threshold to be above its exit threshold,
+unfiltered scores and fixed thresholds and duration limits. When thresholds
+overlap, a signal filter, duration model or threshold tracker is configured,
+or the detector is mid-gesture, the streaming detector is used instead.
+"""
+import numpy as np
+
+from app.utils.eye_gesture_detector import (
+    GestureDetector,
+    INVOLUNTARY_BLINK_DURATION, NEUTRAL_GAZE_MARGIN,
+    LEFT_BLINK, RIGHT_BLINK,
+    LOOK_IN_LEFT, LOOK_OUT_RIGHT,
+    LOOK_IN_RIGHT, LOOK_OUT_LEFT,
+    LOOK_UP_LEFT, LOOK_UP_RIGHT,
+)
+
+# Order of events emitted for the same sample: blink, horizontal gaze, up
+_BLINK, _GAZE, _UP = range(3)
+
+
+def _hysteresis(set_mask, reset_mask):
+    """State per sample of a latch set by `set_mask` and cleared by `reset_mask` (disjoint)."""
+    index = np.arange(len(set_mask))
+    last = np.maximum.accumulate(np.where(set_mask | reset_mask, index, -1))
+    state = np.zeros(len(set_mask), dtype=bool)
+    seen = last >= 0
+    state[seen] = set_mask[last[seen]]
+    return state
+
+
+def _edges(state):
+    """Indices where `state` turns on and where it turns off (starting from off)."""
+    previous = np.zeros_like(state)
+    previous[1:] = state[:-1]
+    return np.flatnonzero(state & ~previous), np.flatnonzero(~state & previous)
+
+
+def can_vectorize(detector):
+    """True if detect_batch() can skip the streaming fallback for `detector`."""
+    return (
+        isinstance(detector, GestureDetector)
+        and detector.closed_threshold > detector.open_threshold
+        and detector.gaze_enter_threshold > detector.gaze_exit_threshold
+        and detector.gaze_up_enter_threshold > detector.gaze_up_exit_threshold
+        and detector.filters is None
+        and detector.duration_model is None
+        and detector.threshold_tracker is None
+        and not (detector.eye_closed or detector.looking_left or detector.looking_right or detector.looking_up)
+    )
+
+
+def _blink_events(t, blink, d):
+    on, off = _edges(_hysteresis(blink > d.closed_threshold, blink < d.open_threshold))
+    duration = t[off] - t[on[:len(off)]]
+    keep = duration > INVOLUNTARY_BLINK_DURATION
+    names = np.where(
+        duration < d.max_fast_blink_duration, "FB",
+        np.where(duration < d.max_slow_blink_duration, "SB", "VSB")
+    )
+    return off[keep], names[keep]
+
+
+def _up_events(t, up, d):
+    on, off = _edges(_hysteresis(up > d.gaze_up_enter_threshold, up < d.gaze_up_exit_threshold))
+    keep = t[off] - t[on[:len(off)]] < d.max_slow_gaze_duration
+    return off[keep], np.full(int(keep.sum()), "FU")
+
+
+def _gaze_events(left, right, d):
+    # Neutral-zone samples leave the state machine untouched; drop them
+    active = np.flatnonzero(np.abs(left - right) >= NEUTRAL_GAZE_MARGIN)
+    left, right = left[active], right[active]
+
+    left_enter = left > d.gaze_enter_threshold
+    looking_left = _hysteresis(left_enter, left < d.gaze_exit_threshold)
+    left_before = np.zeros_like(looking_left)
+    left_before[1:] = looking_left[:-1]
+
+    # Right can only start from neutral and is cut short by a left onset
+    right_enter = (right > d.gaze_enter_threshold) & ~left_enter & ~left_before
+    right_exit = left_enter | (right < d.gaze_exit_threshold)
+    _, right_off = _edges(_hysteresis(right_enter, right_exit))
+    right_off = right_off[~left_enter[right_off]]
+
+    _, left_off = _edges(looking_left)
+    index = np.concatenate((active[left_off], active[right_off]))
+    names = np.concatenate((np.full(len(left_off), "FL"), np.full(len(right_off), "FR")))
+    return index, names
+
+
+def detect_batch(timestamps, scores, detector):
+    """
+    Events for samples `timestamps` (float64[N], seconds) with `scores`
+    (float[N, 8], GESTURE_BLENDSHAPES order), using `detector`'s thresholds.
+    Returns [(timestamp, event), ...] in the order the streaming detector
+    would emit them.
+    """
+    if not can_vectorize(detector):
+        from app.utils.blendshape_recorder import replay
+        return replay(timestamps, scores, detector)
+
+    t = np.asarray(timestamps, dtype=np.float64)
+    s = np.asarray(scores).astype(np.float64)
+    if len(t) == 0:
+        return []
+
+    blink = (s[:, LEFT_BLINK] + s[:, RIGHT_BLINK]) / 2
+    left = (s[:, LOOK_OUT_LEFT] + s[:, LOOK_IN_RIGHT]) / 2
+    right = (s[:, LOOK_OUT_RIGHT] + s[:, LOOK_IN_LEFT]) / 2
+    up = (s[:, LOOK_UP_LEFT] + s[:, LOOK_UP_RIGHT]) / 2
+
+    parts = (_blink_events(t, blink, detector), _gaze_events(left, right, detector), _up_events(t, up, detector))
+    index = np.concatenate([p[0] for p in parts])
+    names = np.concatenate([p[1] for p in parts])
+    channel = np.concatenate([np.full(len(p[0]), c) for c, p in zip((_BLINK, _GAZE, _UP), parts)])
+
+    order = np.lexsort((channel, index))
+    return list(zip(t[index[order]].tolist(), names[order].tolist()))
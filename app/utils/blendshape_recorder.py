@@ -0,0 +1,107 @@
+import os
+from pathlib import Path
+
+import numpy as np
+from app.utils.eye_gesture_detector import GESTURE_BLENDSHAPES
+
+# One row per processed frame: sample timestamp (s) + the gesture scores
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("scores", "<f4", (len(GESTURE_BLENDSHAPES),)),
+])
+
+
+# -------------------------------------------------------------------
+# RECORDING
+# -------------------------------------------------------------------
+class BlendshapeRecorder:
+    """
+    Appends (timestamp, scores) rows to a memory-mapped .npy file.
+
+    The file is preallocated and doubled when full; close() trims it to the
+    rows actually written so it loads as a plain structured array.
+    """
+
+    def __init__(self, path, capacity=30 * 60 * 10):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+        self._data = np.lib.format.open_memmap(
+            self.path, mode="w+", dtype=RECORD_DTYPE, shape=(capacity,)
+        )
+
+    def record(self, timestamp, scores):
+        if self._data is None:
+            return
+        if self.count == len(self._data):
+            self._grow()
+        self._data["timestamp"][self.count] = timestamp
+        self._data["scores"][self.count] = scores
+        self.count += 1
+
+    def _grow(self):
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        grown = np.lib.format.open_memmap(
+            tmp_path, mode="w+", dtype=RECORD_DTYPE, shape=(len(self._data) * 2,)
+        )
+        grown[:self.count] = self._data[:self.count]
+        grown.flush()
+        del self._data
+        del grown
+        os.replace(tmp_path, self.path)
+        self._data = np.load(self.path, mmap_mode="r+")
+
+    def close(self):
+        if self._data is None:
+            return
+        rows = np.array(self._data[:self.count])
+        del self._data
+        self._data = None
+        np.save(self.path, rows)
+        print(f"[record] Saved {self.count} samples to {self.path}")
+
+
+def load_recording(path):
+    """Returns (timestamps float64[N], scores float32[N, 8]) of a recording."""
+    data = np.load(path, mmap_mode="r")
+    return np.ascontiguousarray(data["timestamp"]), np.ascontiguousarray(data["scores"])
+
+
+# -------------------------------------------------------------------
+# REPLAY
+# -------------------------------------------------------------------
+def replay(timestamps, scores, detector):
+    """
+    Feed a recorded stream through `detector` as fast as possible, timing
+    gestures with the recorded sample timestamps.
+    Returns the emitted events as a list of (timestamp, event).
+    """
+    events = []
+    for timestamp, row in zip(timestamps.tolist(), scores):
+        for event in detector.update_scores(row, timestamp):
+            events.append((timestamp, event))
+    return events
+
+
+class ReplayEventSource:
+    """
+    Drop-in for get_gesture_frame() that replays a recording one sample per
+    call, so DataProvider can be driven without a camera.
+    """
+
+    def __init__(self, timestamps, scores, detector):
+        self.timestamps = timestamps.tolist()
+        self.scores = scores
+        self.detector = detector
+        self.position = 0
+
+    @property
+    def finished(self):
+        return self.position >= len(self.timestamps)
+
+    def __call__(self):
+        if self.finished:
+            return None
+        events = self.detector.update_scores(self.scores[self.position], self.timestamps[self.position])
+        self.position += 1
+        return events[0] if len(events) == 1 else None
@@ -0,0 +1,32 @@
+import numpy as np
+from app.utils.eye_gesture_detector import GESTURE_BLENDSHAPES
+
+
+class BlendshapeVector:
+    """
+    Extracts the gesture blendshape scores into a reused float32 vector.
+
+    The category-name -> index table is built once from the first result, so
+    each frame is a handful of indexed reads instead of a name scan per score.
+    """
+
+    def __init__(self, names=GESTURE_BLENDSHAPES):
+        self.names = names
+        self.indices = None
+        self.category_count = 0
+        self.scores = np.zeros(len(names), dtype=np.float32)
+
+    def build_index(self, blendshapes):
+        positions = {b.category_name: i for i, b in enumerate(blendshapes)}
+        self.indices = tuple(positions.get(name, -1) for name in self.names)
+        self.category_count = len(blendshapes)
+
+    def fill(self, blendshapes):
+        """Write the scores of one face's blendshapes into `self.scores`."""
+        if self.indices is None or len(blendshapes) != self.category_count:
+            self.build_index(blendshapes)
+
+        scores = self.scores
+        for slot, index in enumerate(self.indices):
+            scores[slot] = blendshapes[index].score if index >= 0 else 0.0
+        return scores
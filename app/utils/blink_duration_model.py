@@ -0,0 +1,166 @@
+import json
+import math
+import os
+from pathlib import Path
+
+from app.utils.eye_gesture_detector import INVOLUNTARY_BLINK_DURATION
+
+
+class BlinkDurationModel:
+    """
+    Online three-component Gaussian mixture over log blink durations
+    (fast / slow / very slow blink), learned from the user's own blinks.
+
+    Each observed duration updates the components' running sufficient
+    statistics with step size `step` (online EM), so the model tracks the
+    last few dozen blinks in constant time and memory. boundaries() returns
+    the durations where adjacent components are equally likely; they become
+    the detector's max_fast / max_slow blink durations. The whole state is
+    nine numbers, saved as JSON every `save_every` observations.
+
+    A class the user stops making (no enters for a while) must not be
+    captured by its neighbour: its weight is floored at MIN_WEIGHT, it only
+    moves for blinks it is at least MIN_RESPONSIBILITY likely to explain,
+    and max_slow stays SLOW_SIGMAS standard deviations above the slow blinks.
+    """
+
+    MIN_SIGMA = 0.08           # log-seconds
+    MIN_WEIGHT = 0.05
+    MIN_RESPONSIBILITY = 0.1
+    SLOW_SIGMAS = 2.0
+    MIN_GAP = math.log(1.25)   # neighbouring means stay at least 25 % apart
+    LIMITS = (0.12, 2.5)       # boundaries are clamped to this range (s)
+
+    def __init__(self, max_fast=0.4, max_slow=0.8, step=0.05, warmup=10, path=None, save_every=10):
+        means = (math.log(max_fast / 2), math.log((max_fast + max_slow) / 2), math.log(max_slow * 1.5))
+        sigma = 0.3
+        # Sufficient statistics per component: weight, weighted sum, weighted sum of squares
+        self.n = [1 / 3] * 3
+        self.s = [m / 3 for m in means]
+        self.q = [(sigma * sigma + m * m) / 3 for m in means]
+        self.step = step
+        self.warmup = warmup
+        self.observations = 0
+        self.path = Path(path) if path else None
+        self.save_every = save_every
+        self.defaults = (max_fast, max_slow)
+
+    # --- mixture parameters from the statistics ---
+    def components(self):
+        """[(weight, mean, sigma), ...] in log-seconds, ordered by mean."""
+        out = []
+        for n, s, q in zip(self.n, self.s, self.q):
+            mean = s / n
+            sigma = math.sqrt(max(q / n - mean * mean, self.MIN_SIGMA ** 2))
+            out.append((n, mean, sigma))
+        return sorted(out, key=lambda c: c[1])
+
+    @staticmethod
+    def _log_density(component, x):
+        weight, mean, sigma = component
+        z = (x - mean) / sigma
+        return math.log(weight) - math.log(sigma) - 0.5 * z * z
+
+    def observe(self, duration):
+        """Fold one blink duration (s) into the model."""
+        if duration <= INVOLUNTARY_BLINK_DURATION:
+            return
+        x = math.log(duration)
+        logs = [self._log_density(c, x) for c in zip(self.n, self._means(), self._sigmas())]
+        top = max(logs)
+        weights = [math.exp(v - top) for v in logs]
+        total = sum(weights)
+
+        eta = self.step
+        for k, w in enumerate(weights):
+            r = w / total
+            n = max((1 - eta) * self.n[k] + eta * r, self.MIN_WEIGHT)
+            if r < self.MIN_RESPONSIBILITY:
+                # Only the weight changes; rescaling keeps mean and variance
+                self.s[k] *= n / self.n[k]
+                self.q[k] *= n / self.n[k]
+                self.n[k] = n
+                continue
+            s = (1 - eta) * self.s[k] + eta * r * x
+            q = (1 - eta) * self.q[k] + eta * r * x * x
+            scale = n / ((1 - eta) * self.n[k] + eta * r)
+            self.n[k], self.s[k], self.q[k] = n, s * scale, q * scale
+        self._keep_apart()
+
+        self.observations += 1
+        if self.path is not None and self.observations % self.save_every == 0:
+            self.save()
+
+    def _means(self):
+        return [s / n for n, s in zip(self.n, self.s)]
+
+    def _sigmas(self):
+        return [
+            math.sqrt(max(q / n - (s / n) ** 2, self.MIN_SIGMA ** 2))
+            for n, s, q in zip(self.n, self.s, self.q)
+        ]
+
+    def _keep_apart(self):
+        # Components are identified by their order; stop them merging or swapping
+        means = self._means()
+        for k in range(1, 3):
+            lowest = means[k - 1] + self.MIN_GAP
+            if means[k] < lowest:
+                shift = lowest - means[k]
+                self.s[k] += shift * self.n[k]
+                self.q[k] += (2 * means[k] * shift + shift * shift) * self.n[k]
+                means[k] = lowest
+
+    def _boundary(self, a, b):
+        """Log-duration between components a < b where both are equally likely."""
+        lo, hi = a[1], b[1]
+        f = lambda x: self._log_density(a, x) - self._log_density(b, x)
+        if f(lo) <= 0 or f(hi) >= 0:
+            return (lo + hi) / 2
+        for _ in range(30):
+            mid = (lo + hi) / 2
+            if f(mid) > 0:
+                lo = mid
+            else:
+                hi = mid
+        return (lo + hi) / 2
+
+    def boundaries(self):
+        """(max_fast_blink_duration, max_slow_blink_duration) in seconds."""
+        if self.observations < self.warmup:
+            return self.defaults
+        fast, slow, very_slow = self.components()
+        low, high = self.LIMITS
+        max_fast = min(max(math.exp(self._boundary(fast, slow)), low), high)
+        max_slow = max(
+            math.exp(self._boundary(slow, very_slow)),
+            math.exp(slow[1] + self.SLOW_SIGMAS * slow[2]),
+            max_fast * 1.25
+        )
+        max_slow = min(max_slow, high)
+        return max_fast, max_slow
+
+    # --- persistence ---
+    def to_dict(self):
+        return {"n": self.n, "s": self.s, "q": self.q, "observations": self.observations}
+
+    def save(self, path=None):
+        path = Path(path or self.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        """Model saved at `path`, or a fresh one (seeded from kwargs) if there is none."""
+        model = cls(path=path, **kwargs)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            model.n, model.s, model.q = list(data["n"]), list(data["s"]), list(data["q"])
+            model.observations = int(data["observations"])
+        except (OSError, ValueError, KeyError):
+            pass
+        return model
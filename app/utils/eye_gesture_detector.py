@@ -1,14 +1,69 @@
 from time import perf_counter
 
-class GestureDetector:
+# Blendshape categories the detector consumes, in update() argument order.
+# A score vector laid out like this can be passed to update_scores().
+GESTURE_BLENDSHAPES = (
+    "eyeBlinkLeft", "eyeBlinkRight",
+    "eyeLookInLeft", "eyeLookOutRight",
+    "eyeLookInRight", "eyeLookOutLeft",
+    "eyeLookUpLeft", "eyeLookUpRight",
+)
+(
+    LEFT_BLINK, RIGHT_BLINK,
+    LOOK_IN_LEFT, LOOK_OUT_RIGHT,
+    LOOK_IN_RIGHT, LOOK_OUT_LEFT,
+    LOOK_UP_LEFT, LOOK_UP_RIGHT,
+) = range(len(GESTURE_BLENDSHAPES))
+
+# Eye closures shorter than this (s) are involuntary blinks, not gestures
+INVOLUNTARY_BLINK_DURATION = 0.05
+# Horizontal gaze scores closer than this are the neutral zone (noise)
+NEUTRAL_GAZE_MARGIN = 0.05
+
+
+class ScoreVectorInput:
+    """update_scores() for detectors with GestureDetector's update() signature."""
+
+    def update_scores(self, scores, timestamp=None):
+        """update() from a score vector laid out like GESTURE_BLENDSHAPES."""
+        s = scores.tolist()
+        return self.update(
+            s[LEFT_BLINK], s[RIGHT_BLINK],
+            s[LOOK_IN_LEFT], s[LOOK_OUT_RIGHT],
+            s[LOOK_IN_RIGHT], s[LOOK_OUT_LEFT],
+            s[LOOK_UP_LEFT], s[LOOK_UP_RIGHT],
+            timestamp
+        )
+
+
+class GestureDetector(ScoreVectorInput):
     def __init__(
         self, closed_threshold=0.6, open_threshold=0.2, max_fast_blink_duration=0.4,
         max_slow_blink_duration=0.8,
         gaze_enter_threshold=0.6, gaze_exit_threshold=0.55,
         max_fast_gaze_duration=0.5, max_slow_gaze_duration=1.0,
-        gaze_up_enter_threshold=0.2, gaze_up_exit_threshold=0.18
+        gaze_up_enter_threshold=0.2, gaze_up_exit_threshold=0.18,
+        clock=perf_counter, signal_filter=None, duration_model=None, threshold_tracker=None
     ):
+        # Fallback time source when update() is not given a sample timestamp
+        self.clock = clock
+
+        # Optional smoothing of the combined scores before thresholding;
+        # `signal_filter` creates one filter (see signal_filters.py) per signal
+        self.filters = None
+        if signal_filter is not None:
+            self.filters = {name: signal_filter() for name in ("blink", "left", "right", "up")}
+
+        # `threshold_tracker` (a QuantileThresholds) re-derives the hysteresis
+        # thresholds below from running score quantiles on every sample
+        self.threshold_tracker = threshold_tracker
+
         # Blink Detection
+        # `duration_model` (a BlinkDurationModel) re-learns the FB/SB/VSB
+        # duration limits from each completed blink
+        self.duration_model = duration_model
+        if duration_model is not None:
+            max_fast_blink_duration, max_slow_blink_duration = duration_model.boundaries()
         self.closed_threshold = closed_threshold
         self.open_threshold = open_threshold
         self.max_fast_blink_duration = max_fast_blink_duration
@@ -32,40 +87,68 @@ class GestureDetector:
         self.looking_start_time_up = 0
         self.looking_up = False
 
-    def updateBlinks(self, left_blink, right_blink):
+    def updateBlinks(self, left_blink, right_blink, timestamp=None):
         blink_events = []
+        now = self.clock() if timestamp is None else timestamp
 
         blink = (left_blink + right_blink) / 2
+        if self.filters is not None:
+            blink = self.filters["blink"].update(blink, now)
+        if self.threshold_tracker is not None:
+            held = self.eye_closed and now - self.blink_start_time < self.threshold_tracker.max_hold
+            thresholds = self.threshold_tracker.observe("blink", blink, held, self.open_threshold)
+            if thresholds is not None:
+                self.open_threshold, self.closed_threshold = thresholds
 
-        involountary_blink_duration = 0.05
         if blink > self.closed_threshold and not self.eye_closed:
             self.eye_closed = True
-            self.blink_start_time = perf_counter()
+            self.blink_start_time = now
         elif blink < self.open_threshold and self.eye_closed:
             self.eye_closed = False
-            duration = perf_counter() - self.blink_start_time
-            if duration > involountary_blink_duration:
+            duration = now - self.blink_start_time
+            if duration > INVOLUNTARY_BLINK_DURATION:
                 if duration < self.max_fast_blink_duration:
                     blink_events.append("FB")
                 elif duration < self.max_slow_blink_duration:
                     blink_events.append("SB")
                 else:
                     blink_events.append("VSB")
+                if self.duration_model is not None:
+                    self.duration_model.observe(duration)
+                    self.max_fast_blink_duration, self.max_slow_blink_duration = self.duration_model.boundaries()
 
         return blink_events
 
     def updateHorizontalGaze(
         self, 
         eye_look_in_left, eye_look_out_right,
-        eye_look_in_right, eye_look_out_left
+        eye_look_in_right, eye_look_out_left,
+        timestamp=None
     ):
         gaze_event = []
+        now = self.clock() if timestamp is None else timestamp
 
         eye_look_left = (eye_look_out_left + eye_look_in_right) / 2
         eye_look_right = (eye_look_out_right + eye_look_in_left) / 2
+        if self.filters is not None:
+            eye_look_left = self.filters["left"].update(eye_look_left, now)
+            eye_look_right = self.filters["right"].update(eye_look_right, now)
+        if self.threshold_tracker is not None:
+            held = (
+                self.looking_left and now - self.looking_start_time_left < self.threshold_tracker.max_hold
+                or self.looking_right and now - self.looking_start_time_right < self.threshold_tracker.max_hold
+            )
+            value = (
+                eye_look_left if self.looking_left
+                else eye_look_right if self.looking_right
+                else max(eye_look_left, eye_look_right)
+            )
+            thresholds = self.threshold_tracker.observe("gaze", value, held, self.gaze_exit_threshold)
+            if thresholds is not None:
+                self.gaze_exit_threshold, self.gaze_enter_threshold = thresholds
 
         # Neutral zone (avoid small noise)
-        if abs(eye_look_left - eye_look_right) < 0.05:
+        if abs(eye_look_left - eye_look_right) < NEUTRAL_GAZE_MARGIN:
             return []
 
         if self.looking_left:
@@ -77,10 +160,10 @@ class GestureDetector:
         if eye_look_left > self.gaze_enter_threshold or self.looking_left:
             if not self.looking_left:
                 self.looking_left = True
-                self.looking_start_time_left = perf_counter()
+                self.looking_start_time_left = now
             elif eye_look_left < self.gaze_exit_threshold and self.looking_left:
                 self.looking_left = False
-                duration = perf_counter() - self.looking_start_time_left
+                duration = now - self.looking_start_time_left
                 if duration < self.max_slow_gaze_duration:
                     gaze_event.append("FL")
                 else:
@@ -92,10 +175,10 @@ class GestureDetector:
         elif eye_look_right > self.gaze_enter_threshold or self.looking_right:
             if not self.looking_right:
                 self.looking_right = True
-                self.looking_start_time_right = perf_counter()
+                self.looking_start_time_right = now
             elif eye_look_right < self.gaze_exit_threshold and self.looking_right:
                 self.looking_right = False
-                duration = perf_counter() - self.looking_start_time_right
+                duration = now - self.looking_start_time_right
                 if duration < self.max_fast_gaze_duration:
                     gaze_event.append("FR")
                 #elif duration < self.max_slow_gaze_duration:
@@ -105,17 +188,25 @@ class GestureDetector:
 
         return gaze_event
 
-    def updateUpGaze(self, eyeLookUpLeft, eyeLookUpRight):
+    def updateUpGaze(self, eyeLookUpLeft, eyeLookUpRight, timestamp=None):
         gaze_up_event = []
+        now = self.clock() if timestamp is None else timestamp
 
         gaze_up = (eyeLookUpLeft + eyeLookUpRight) / 2
+        if self.filters is not None:
+            gaze_up = self.filters["up"].update(gaze_up, now)
+        if self.threshold_tracker is not None:
+            held = self.looking_up and now - self.looking_start_time_up < self.threshold_tracker.max_hold
+            thresholds = self.threshold_tracker.observe("up", gaze_up, held, self.gaze_up_exit_threshold)
+            if thresholds is not None:
+                self.gaze_up_exit_threshold, self.gaze_up_enter_threshold = thresholds
 
         if gaze_up > self.gaze_up_enter_threshold and not self.looking_up:
             self.looking_up = True
-            self.looking_start_time_up = perf_counter()
+            self.looking_start_time_up = now
         elif gaze_up < self.gaze_up_exit_threshold and self.looking_up:
             self.looking_up = False
-            duration = perf_counter() - self.looking_start_time_up
+            duration = now - self.looking_start_time_up
             if duration < self.max_slow_gaze_duration:
                 gaze_up_event.append("FU")
             #elif duration < self.max_slow_gaze_duration:
@@ -128,12 +219,22 @@ class GestureDetector:
         left_blink, right_blink,
         eye_look_in_left, eye_look_out_right,
         eye_look_in_right, eye_look_out_left,
-        eyeLookUpLeft, eyeLookUpRight
+        eyeLookUpLeft, eyeLookUpRight,
+        timestamp=None
     ):
-        blink_event = self.updateBlinks(left_blink, right_blink)
+        """
+        Process one sample. `timestamp` (seconds) is when the frame was
+        captured; durations are measured between sample timestamps so
+        queueing and inference delays don't distort them. Without it the
+        detector's clock is read at processing time.
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+        blink_event = self.updateBlinks(left_blink, right_blink, timestamp)
         gaze_event = self.updateHorizontalGaze(
-            eye_look_in_left, eye_look_out_right, eye_look_in_right, eye_look_out_left
+            eye_look_in_left, eye_look_out_right, eye_look_in_right, eye_look_out_left,
+            timestamp
         )
-        gaze_up_event = self.updateUpGaze(eyeLookUpLeft, eyeLookUpRight)
+        gaze_up_event = self.updateUpGaze(eyeLookUpLeft, eyeLookUpRight, timestamp)
 
         return blink_event + gaze_event + gaze_up_event
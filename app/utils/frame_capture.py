@@ -0,0 +1,135 @@
+import threading
+from collections import namedtuple
+from time import perf_counter, sleep
+
+from app.utils.frame_sources import WebcamSource
+from app.utils.tracing import span
+
+# A captured frame: monotonically increasing sequence number, perf_counter()
+# timestamp taken as soon as the backend returned it, the BGR image, the
+# source's own timestamp (seconds, None if it has none) and whether it repeats
+# the previous frame's content.
+Frame = namedtuple("Frame", ["seq", "timestamp", "image", "pts", "duplicate"])
+
+
+class FrameDeduplicator:
+    """
+    Spots frames a backend delivers twice: same backend timestamp, or (when
+    the source has none) the same hash of a coarsely downsampled image.
+    """
+
+    HASH_STRIDE = 16
+
+    def __init__(self, use_hash=True):
+        self.use_hash = use_hash
+        self._last_pts = None
+        self._last_hash = None
+
+    def is_duplicate(self, image, pts):
+        if pts is not None:
+            duplicate = pts == self._last_pts
+            self._last_pts = pts
+            return duplicate
+        if not self.use_hash:
+            return False
+        digest = hash(image[::self.HASH_STRIDE, ::self.HASH_STRIDE].tobytes())
+        duplicate = digest == self._last_hash
+        self._last_hash = digest
+        return duplicate
+
+
+class FrameGrabber:
+    """
+    Owns a frame source (webcam, video file, ...) on a dedicated producer
+    thread.
+
+    Only the newest frame is kept (single-slot buffer); older frames that were
+    never picked up are dropped. Readers never block on camera I/O.
+    """
+
+    READ_RETRY_DELAY = 0.01
+
+    def __init__(self, source=0, hash_dedup=True):
+        # Plain ints keep the old cv2.VideoCapture(index) behaviour
+        self.source = WebcamSource(source) if isinstance(source, int) else source
+        self.deduplicator = FrameDeduplicator(use_hash=hash_dedup)
+        self.duplicates = 0
+        self._cond = threading.Condition()
+        self._latest = None
+        self._taken_seq = 0
+        self._seq = 0
+        self.dropped = 0
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="drishti-capture", daemon=True)
+        self._thread.start()
+
+    # ---------------------------------------------------------------
+    # Producer thread
+    # ---------------------------------------------------------------
+    def _run(self):
+        while self._running:
+            with span("cap.read"):
+                success, image = self.source.read()
+            timestamp = perf_counter()
+            if not success:
+                if self.source.exhausted:
+                    break
+                sleep(self.READ_RETRY_DELAY)
+                continue
+
+            pts = self.source.backend_timestamp()
+            duplicate = self.deduplicator.is_duplicate(image, pts)
+            with self._cond:
+                if duplicate:
+                    self.duplicates += 1
+                if self._latest is not None and self._latest.seq > self._taken_seq:
+                    self.dropped += 1
+                self._seq += 1
+                self._latest = Frame(self._seq, timestamp, image, pts, duplicate)
+                self._cond.notify_all()
+
+        # Finite source ran out (or release() was called): wake any waiters
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+    @property
+    def running(self):
+        return self._running
+
+    # ---------------------------------------------------------------
+    # Consumer API
+    # ---------------------------------------------------------------
+    def latest(self):
+        """Return the newest Frame (or None before the first one). Never blocks."""
+        with self._cond:
+            frame = self._latest
+            if frame is not None:
+                self._taken_seq = frame.seq
+        return frame
+
+    def wait_next(self, after_seq=0, timeout=None):
+        """Wait for a frame newer than `after_seq`. Returns None on timeout."""
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._latest is not None and self._latest.seq > after_seq or not self._running,
+                timeout
+            ) or not self._running:
+                return None
+            frame = self._latest
+            self._taken_seq = frame.seq
+        return frame
+
+    def read(self):
+        """VideoCapture-compatible read: (success, image) of the newest frame."""
+        frame = self.latest()
+        if frame is None:
+            return False, None
+        return True, frame.image
+
+    def release(self):
+        self._running = False
+        with self._cond:
+            self._cond.notify_all()
+        self._thread.join(timeout=1.0)
+        self.source.release()
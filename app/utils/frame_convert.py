@@ -0,0 +1,35 @@
+import cv2
+import numpy as np
+
+
+class RgbConverter:
+    """
+    BGR -> RGB conversion into reused buffers.
+
+    cvtColor writes through its `dst` argument into one of `slots` buffers
+    used round-robin, so a result stays valid for the next `slots - 1`
+    conversions (enough for frames still in flight in LIVE_STREAM mode).
+    Each slot is a flat byte array that only grows; a frame or ROI crop of a
+    new size is a contiguous view of its prefix, so the steady state
+    allocates nothing.
+    """
+
+    def __init__(self, slots=4):
+        self._storage = [np.empty(0, dtype=np.uint8) for _ in range(slots)]
+        self._next = 0
+        self.reallocations = 0
+
+    def _buffer(self, shape):
+        slot = self._next
+        self._next = (slot + 1) % len(self._storage)
+        size = int(np.prod(shape))
+        if self._storage[slot].size < size:
+            self._storage[slot] = np.empty(size, dtype=np.uint8)
+            self.reallocations += 1
+        return self._storage[slot][:size].reshape(shape)
+
+    def convert(self, image):
+        """RGB copy of the BGR `image` in a reused buffer."""
+        dst = self._buffer(image.shape)
+        cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=dst)
+        return dst
@@ -0,0 +1,82 @@
+from app.utils.eye_gesture_detector import (
+    LEFT_BLINK, RIGHT_BLINK,
+    LOOK_IN_LEFT, LOOK_OUT_RIGHT,
+    LOOK_IN_RIGHT, LOOK_OUT_LEFT,
+    LOOK_UP_LEFT, LOOK_UP_RIGHT,
+)
+
+
+class AdaptiveRateScheduler:
+    """
+    Decides which frames are worth running the landmarker on.
+
+    Every frame is sampled while a gesture is in progress (the detector has
+    an eye closed or a gaze held) or about to start (the last scores are past
+    `arm_fraction` of an enter threshold), since blink and gaze durations are
+    timed then. After `idle_after` seconds without either the rate drops to
+    `idle_fps`, and to `absent_fps` while no face is found.
+
+    A gaze the detector keeps latched only because the scores sit in its
+    neutral zone (already below the exit threshold) is not "in progress":
+    the next non-neutral sample ends it whatever the frame rate.
+    """
+
+    ACTIVE, IDLE, ABSENT = "active", "idle", "absent"
+
+    def __init__(self, idle_fps=10, absent_fps=4, idle_after=1.0, arm_fraction=0.5):
+        self.idle_interval = 1.0 / idle_fps if idle_fps else 0.0
+        self.absent_interval = 1.0 / absent_fps if absent_fps else 0.0
+        self.idle_after = idle_after
+        self.arm_fraction = arm_fraction
+        self.state = self.ACTIVE
+        self._last_active = None
+        self._last_sample = None
+        self.sampled = 0
+        self.skipped = 0
+
+    @staticmethod
+    def gesture_in_progress(detector, scores):
+        look_left = (scores[LOOK_OUT_LEFT] + scores[LOOK_IN_RIGHT]) / 2
+        look_right = (scores[LOOK_OUT_RIGHT] + scores[LOOK_IN_LEFT]) / 2
+        return (
+            detector.eye_closed
+            or detector.looking_up
+            or detector.looking_left and look_left >= detector.gaze_exit_threshold
+            or detector.looking_right and look_right >= detector.gaze_exit_threshold
+        )
+
+    def armed(self, detector, scores):
+        """True if the last scores are close enough to a threshold that a gesture may begin."""
+        blink = (scores[LEFT_BLINK] + scores[RIGHT_BLINK]) / 2
+        look_left = (scores[LOOK_OUT_LEFT] + scores[LOOK_IN_RIGHT]) / 2
+        look_right = (scores[LOOK_OUT_RIGHT] + scores[LOOK_IN_LEFT]) / 2
+        look_up = (scores[LOOK_UP_LEFT] + scores[LOOK_UP_RIGHT]) / 2
+        gaze_arm = detector.gaze_enter_threshold * self.arm_fraction
+        return (
+            blink > detector.open_threshold
+            or max(look_left, look_right) > gaze_arm
+            or look_up > detector.gaze_up_enter_threshold * self.arm_fraction
+        )
+
+    def should_sample(self, timestamp, detector, face_present, scores):
+        """True if the frame at `timestamp` should go through the landmarker."""
+        if not face_present:
+            self.state = self.ABSENT
+            interval = self.absent_interval
+        elif self.gesture_in_progress(detector, scores) or self.armed(detector, scores):
+            self.state = self.ACTIVE
+            self._last_active = timestamp
+            interval = 0.0
+        elif self._last_active is not None and timestamp - self._last_active < self.idle_after:
+            self.state = self.ACTIVE
+            interval = 0.0
+        else:
+            self.state = self.IDLE
+            interval = self.idle_interval
+
+        if self._last_sample is not None and timestamp - self._last_sample < interval:
+            self.skipped += 1
+            return False
+        self._last_sample = timestamp
+        self.sampled += 1
+        return True
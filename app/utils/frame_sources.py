@@ -0,0 +1,301 @@
+import os
+from pathlib import Path
+from time import perf_counter, sleep
+
+import cv2
+import numpy as np
+
+# Environment override for the configured source, e.g.
+#   DRISHTI_SOURCE=video:cache/recordings/session.mp4 python main.py
+SOURCE_ENV_VAR = "DRISHTI_SOURCE"
+DEFAULT_SOURCE = "webcam:0"
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+# -------------------------------------------------------------------
+# BACKENDS
+# -------------------------------------------------------------------
+# Every source exposes the cv2.VideoCapture subset FrameGrabber needs:
+#   read() -> (success, image), release(), and `exhausted` once a finite
+#   source has run out of frames.
+# backend_timestamp() gives the source's own time (seconds) for the frame
+# just read, or None when the grab time should be used instead. A source
+# that can return None for some frames and not others must report its time
+# on the perf_counter() base, so a stream never mixes two clocks.
+
+class WebcamSource:
+    """
+    A camera via cv2.VideoCapture. `settings` (see camera_settings()) are
+    requested from the driver when it is opened; negotiated() reports what
+    the backend actually accepted.
+    """
+
+    def __init__(self, index=0, backend_timestamps=False, settings=None):
+        self.cap = cv2.VideoCapture(index)
+        self.backend_timestamps = backend_timestamps
+        # perf_counter() - CAP_PROP_POS_MSEC at the first frame that had one
+        self._pts_offset = None
+        self.exhausted = False
+        if settings:
+            self.apply(settings)
+
+    def apply(self, settings):
+        # FOURCC goes first: some V4L2 drivers reset the size when it changes
+        fourcc = settings.get("fourcc")
+        if fourcc:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc[:4].ljust(4)))
+        if settings.get("width"):
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, settings["width"])
+        if settings.get("height"):
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, settings["height"])
+        if settings.get("fps"):
+            self.cap.set(cv2.CAP_PROP_FPS, settings["fps"])
+        if settings.get("buffer_size"):
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, settings["buffer_size"])
+
+    def negotiated(self):
+        """The format the backend is actually delivering."""
+        code = int(self.cap.get(cv2.CAP_PROP_FOURCC))
+        fourcc = "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)) if code > 0 else ""
+        return {
+            "backend": self.cap.getBackendName() if self.cap.isOpened() else None,
+            "fourcc": fourcc.strip("\x00 "),
+            "width": int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "fps": self.cap.get(cv2.CAP_PROP_FPS),
+            "buffer_size": int(self.cap.get(cv2.CAP_PROP_BUFFERSIZE)),
+        }
+
+    def read(self):
+        return self.cap.read()
+
+    def backend_timestamp(self):
+        if not self.backend_timestamps:
+            return None
+        # Many drivers report 0 for the first frames (some always do); those
+        # fall back to grab time, so the driver clock is moved onto the
+        # perf_counter() base with an offset fixed at its first valid value
+        msec = self.cap.get(cv2.CAP_PROP_POS_MSEC)
+        if msec <= 0:
+            return None
+        if self._pts_offset is None:
+            self._pts_offset = perf_counter() - msec / 1000
+        return msec / 1000 + self._pts_offset
+
+    def release(self):
+        self.cap.release()
+
+
+class _PacedSource:
+    """Optionally throttles read() to `fps`; unpaced sources run flat out."""
+
+    NOMINAL_FPS = 30
+
+    def __init__(self, fps=None):
+        self.interval = 1.0 / fps if fps else 0.0
+        self._next_time = 0.0
+        # Spacing of media timestamps for sources without their own clock
+        self.frame_interval = self.interval or 1.0 / self.NOMINAL_FPS
+        self.frames_read = 0
+
+    def _pace(self):
+        if not self.interval:
+            return
+        delay = self._next_time - perf_counter()
+        if delay > 0:
+            sleep(delay)
+        self._next_time = max(self._next_time, perf_counter()) + self.interval
+
+
+class VideoFileSource(_PacedSource):
+    def __init__(self, path, fps=None, loop=False):
+        super().__init__(fps)
+        self.path = str(path)
+        self.loop = loop
+        self.cap = cv2.VideoCapture(self.path)
+        self.exhausted = False
+        # Added to CAP_PROP_POS_MSEC so timestamps keep increasing across loops
+        self._loop_offset = 0.0
+        self._last_timestamp = 0.0
+
+    def read(self):
+        self._pace()
+        success, image = self.cap.read()
+        if not success and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self._loop_offset = self._last_timestamp + self.frame_interval
+            success, image = self.cap.read()
+        if not success:
+            self.exhausted = True
+        else:
+            self._last_timestamp = self._loop_offset + self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000
+        return success, image
+
+    def backend_timestamp(self):
+        return self._last_timestamp
+
+    def release(self):
+        self.cap.release()
+
+
+class ImageDirectorySource(_PacedSource):
+    def __init__(self, path, fps=None, loop=False):
+        super().__init__(fps)
+        self.files = sorted(
+            p for p in Path(path).iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS
+        )
+        self.loop = loop
+        self.position = 0
+        self.exhausted = not self.files
+
+    def read(self):
+        self._pace()
+        if self.position >= len(self.files):
+            if not self.loop or not self.files:
+                self.exhausted = True
+                return False, None
+            self.position = 0
+
+        image = cv2.imread(str(self.files[self.position]))
+        self.position += 1
+        self.frames_read += 1
+        return image is not None, image
+
+    def backend_timestamp(self):
+        return (self.frames_read - 1) * self.frame_interval
+
+    def release(self):
+        pass
+
+
+class SyntheticSource(_PacedSource):
+    """
+    In-memory noise frames for load testing. A small pool of frames is
+    generated once and cycled, so reading costs no more than a real backend.
+    """
+
+    def __init__(self, width=640, height=480, fps=None, pool_size=8, seed=0):
+        super().__init__(fps)
+        rng = np.random.default_rng(seed)
+        self.frames = [
+            rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+            for _ in range(pool_size)
+        ]
+        self.position = 0
+        self.exhausted = False
+
+    def read(self):
+        self._pace()
+        image = self.frames[self.position % len(self.frames)]
+        self.position += 1
+        self.frames_read += 1
+        return True, image
+
+    def backend_timestamp(self):
+        return (self.frames_read - 1) * self.frame_interval
+
+    def release(self):
+        pass
+
+
+# -------------------------------------------------------------------
+# CAMERA PROBE
+# -------------------------------------------------------------------
+def probe_capture(source, frames=30, idle=0.25):
+    """
+    Measure how a webcam delivers frames. Call before the capture thread
+    starts. Returns a dict with the negotiated format plus:
+        read_ms       median time read() blocks in steady state
+        fps_measured  frames per second actually delivered
+        stale_frames  frames already queued after an `idle` pause (returned
+                      faster than a quarter frame interval)
+        latency_ms    estimated capture queueing lag = stale_frames x interval
+    """
+    report = source.negotiated()
+    source.read()  # first read can include stream start-up
+
+    start = perf_counter()
+    reads = []
+    for _ in range(frames):
+        t0 = perf_counter()
+        success, _ = source.read()
+        if success:
+            reads.append(perf_counter() - t0)
+    elapsed = perf_counter() - start
+    if not reads:
+        return dict(report, read_ms=None, fps_measured=0.0, stale_frames=None, latency_ms=None)
+
+    interval = elapsed / len(reads)
+    # Frames that pile up in the driver while nobody reads come back instantly
+    sleep(idle)
+    stale = 0
+    for _ in range(16):
+        t0 = perf_counter()
+        source.read()
+        if perf_counter() - t0 >= interval / 4:
+            break
+        stale += 1
+
+    reads.sort()
+    return dict(
+        report,
+        read_ms=reads[len(reads) // 2] * 1000,
+        fps_measured=len(reads) / elapsed,
+        stale_frames=stale,
+        latency_ms=stale * interval * 1000,
+    )
+
+
+def format_probe(report):
+    return (
+        f"{report['backend']} {report['fourcc'] or '?'} {report['width']}x{report['height']} "
+        f"@ {report['fps']:.0f} fps (measured {report['fps_measured']:.1f}), "
+        f"buffer {report['buffer_size']}, {report['stale_frames']} stale frame(s), "
+        f"~{report['latency_ms'] or 0:.0f} ms queueing"
+    )
+
+
+# -------------------------------------------------------------------
+# FACTORY
+# -------------------------------------------------------------------
+def camera_settings(cfg):
+    """Webcam format requested in config.yaml (empty / 0 keeps the driver default)."""
+    return {
+        "fourcc": cfg.get("camera_fourcc") or "",
+        "width": int(cfg.get("camera_width") or 0),
+        "height": int(cfg.get("camera_height") or 0),
+        "fps": float(cfg.get("camera_fps") or 0),
+        "buffer_size": int(cfg.get("camera_buffer_size") or 0),
+    }
+
+
+def open_frame_source(spec=DEFAULT_SOURCE, fps=None, loop=False, backend_timestamps=False, camera=None):
+    """
+    Open a frame source from a "kind:argument" spec:
+        webcam:0                 camera index
+        video:path/to/file.mp4   video file
+        images:path/to/dir       directory of frames (sorted by name)
+        synthetic:640x480        generated noise frames
+    `fps` paces the file/synthetic sources; `loop` restarts finite ones.
+    `backend_timestamps` makes webcams report CAP_PROP_POS_MSEC; the other
+    sources always report media time. `camera` holds the webcam settings.
+    """
+    kind, _, arg = str(spec).partition(":")
+    kind = kind.strip().lower()
+
+    if kind == "webcam":
+        return WebcamSource(int(arg or 0), backend_timestamps=backend_timestamps, settings=camera)
+    if kind == "video":
+        return VideoFileSource(arg, fps=fps, loop=loop)
+    if kind == "images":
+        return ImageDirectorySource(arg, fps=fps, loop=loop)
+    if kind == "synthetic":
+        width, _, height = (arg or "640x480").lower().partition("x")
+        return SyntheticSource(int(width), int(height), fps=fps)
+    raise ValueError(f"Unknown frame source '{spec}'")
+
+
+def frame_source_spec(cfg):
+    """Source spec from DRISHTI_SOURCE, else config.yaml, else the webcam."""
+    return os.environ.get(SOURCE_ENV_VAR) or cfg.get("frame_source", DEFAULT_SOURCE)
@@ -0,0 +1,87 @@
+import queue
+import threading
+from collections import namedtuple
+
+# A published gesture: event name ("FB", "SB", "VSB", "FL", "FR", "FU"), the
+# sample timestamp of the frame it was detected on, and the capture-to-event
+# latency in seconds (None if unknown).
+GestureEvent = namedtuple("GestureEvent", ["name", "timestamp", "latency"])
+
+
+class Subscription:
+    """
+    One consumer's view of the bus, backed by its own bounded queue.
+    If the consumer falls behind, the oldest queued events are dropped.
+    """
+
+    def __init__(self, bus, maxsize=64):
+        self.bus = bus
+        self.queue = queue.Queue(maxsize)
+        self.dropped = 0
+
+    def _put(self, event):
+        while True:
+            try:
+                self.queue.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def poll_event(self):
+        """Next GestureEvent or None. Never blocks."""
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            return None
+
+    def get_event(self, timeout=None):
+        """Wait up to `timeout` seconds for the next GestureEvent (None on timeout)."""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def poll(self):
+        """Next event name or None -- drop-in for the old get_gesture_frame()."""
+        event = self.poll_event()
+        return event.name if event else None
+
+    def clear(self):
+        """Discard everything queued so far."""
+        while self.poll_event() is not None:
+            pass
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+
+class GestureBus:
+    """Fans published gesture events out to every subscriber's queue."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = ()
+
+    def subscribe(self, maxsize=64):
+        subscription = Subscription(self, maxsize)
+        with self._lock:
+            self._subscribers = self._subscribers + (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers = tuple(s for s in self._subscribers if s is not subscription)
+
+    @property
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    def publish(self, name, timestamp, latency=None):
+        event = GestureEvent(name, timestamp, latency)
+        for subscription in self._subscribers:
+            subscription._put(event)
+        return event
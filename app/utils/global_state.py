@@ -1,2 +1,3 @@
 # app/utils/global_state.py
 main_ui = None
+headless = False  # True in the socket daemon (no Tk windows)
@@ -0,0 +1,237 @@
+import math
+from collections import deque
+from time import perf_counter
+
+from app.utils.eye_gesture_detector import INVOLUNTARY_BLINK_DURATION, ScoreVectorInput
+
+
+class FixedLagViterbi:
+    """
+    Online Viterbi decoding of a small HMM with 1-D Gaussian emissions.
+
+    The state of a sample is committed `lag` samples after it arrives, by
+    backtracking the best path from the newest sample; latency is therefore
+    bounded by `lag` frames. Transitions are sticky: the chance of leaving a
+    state within a step is 1 - exp(-switch_rate * dt), so it follows the real
+    sampling interval. Emission means drift towards the samples committed to
+    each state at `adapt_rate`, which lets the model follow fatigue and
+    lighting instead of fixed thresholds.
+    """
+
+    def __init__(self, means, sigma, switch_rate=1.0, lag=3, adapt_rate=0.01, min_separation=0.1):
+        self.means = list(means)
+        self.initial_means = tuple(means)
+        self.sigma = sigma
+        self.switch_rate = switch_rate
+        self.lag = lag
+        self.adapt_rate = adapt_rate
+        self.min_separation = min_separation
+        self.states = range(len(means))
+        self.scores = None          # log-probability of the best path ending in each state
+        self.history = deque()      # (value, timestamp, backpointers) for uncommitted samples
+        self.last_timestamp = None
+
+    def _emission(self, state, value):
+        z = (value - self.means[state]) / self.sigma
+        return -0.5 * z * z
+
+    def best_state(self):
+        """Most likely state of the newest sample (not yet committed)."""
+        if self.scores is None:
+            return 0
+        return max(self.states, key=self.scores.__getitem__)
+
+    def step(self, value, timestamp):
+        """Add a sample; returns (state, value, timestamp) of the sample committed now, or None."""
+        if self.scores is None:
+            self.scores = [self._emission(s, value) for s in self.states]
+            self.history.append((value, timestamp, None))
+        else:
+            dt = max(timestamp - self.last_timestamp, 1e-3)
+            leave = 1.0 - math.exp(-self.switch_rate * dt)
+            log_stay = math.log(1.0 - leave)
+            log_switch = math.log(leave / (len(self.means) - 1))
+
+            scores, pointers = [], []
+            for s in self.states:
+                best, arg = max(
+                    (self.scores[p] + (log_stay if p == s else log_switch), p) for p in self.states
+                )
+                scores.append(best + self._emission(s, value))
+                pointers.append(arg)
+            top = max(scores)
+            self.scores = [x - top for x in scores]  # keep the numbers small
+            self.history.append((value, timestamp, pointers))
+        self.last_timestamp = timestamp
+
+        if len(self.history) <= self.lag:
+            return None
+
+        # Backtrack from the newest best state to the oldest uncommitted sample
+        state = self.best_state()
+        for i in range(len(self.history) - 1, 0, -1):
+            state = self.history[i][2][state]
+        value, committed_at, _ = self.history.popleft()
+        self._adapt(state, value)
+        return state, value, committed_at
+
+    def _adapt(self, state, value):
+        if not self.adapt_rate:
+            return
+        mean = self.means[state] + self.adapt_rate * (value - self.means[state])
+        # Keep the states ordered and apart so they can't swap meaning
+        if state > 0:
+            mean = max(mean, self.means[state - 1] + self.min_separation)
+        if state < len(self.means) - 1:
+            mean = min(mean, self.means[state + 1] - self.min_separation)
+        self.means[state] = mean
+
+
+class HmmGestureDetector(ScoreVectorInput):
+    """
+    Drop-in alternative to GestureDetector (same update() / update_scores())
+    that decodes eye states with three small HMMs instead of fixed
+    thresholds:
+        blink  : open / closed on the mean blink score
+        gaze   : right / centre / left on (left score - right score)
+        up     : centre / up on the mean look-up score
+    Events are emitted when a committed state segment ends, `lag` samples
+    after it really did; durations use the committed samples' timestamps and
+    the same FB / SB / VSB limits as GestureDetector. The threshold arguments
+    only seed the emission means.
+    """
+
+    OPEN, CLOSED = 0, 1
+    RIGHT, CENTER, LEFT = 0, 1, 2
+    LEVEL, UP = 0, 1
+
+    def __init__(
+        self, closed_threshold=0.6, open_threshold=0.2, max_fast_blink_duration=0.4,
+        max_slow_blink_duration=0.8,
+        gaze_enter_threshold=0.6, gaze_exit_threshold=0.55,
+        max_fast_gaze_duration=0.5, max_slow_gaze_duration=1.0,
+        gaze_up_enter_threshold=0.2, gaze_up_exit_threshold=0.18,
+        clock=perf_counter, signal_filter=None, duration_model=None,
+        lag=3, adapt_rate=0.01, switch_rate=1.0, sigma=0.12
+    ):
+        self.clock = clock
+        self.filters = None
+        if signal_filter is not None:
+            self.filters = {name: signal_filter() for name in ("blink", "gaze", "up")}
+
+        # Kept for callers that read them (calibration, the rate scheduler)
+        self.closed_threshold = closed_threshold
+        self.open_threshold = open_threshold
+        self.gaze_enter_threshold = gaze_enter_threshold
+        self.gaze_exit_threshold = gaze_exit_threshold
+        self.gaze_up_enter_threshold = gaze_up_enter_threshold
+        self.gaze_up_exit_threshold = gaze_up_exit_threshold
+        self.duration_model = duration_model
+        if duration_model is not None:
+            max_fast_blink_duration, max_slow_blink_duration = duration_model.boundaries()
+        self.max_fast_blink_duration = max_fast_blink_duration
+        self.max_slow_blink_duration = max_slow_blink_duration
+        self.max_slow_gaze_duration = max_slow_gaze_duration
+
+        hmm = dict(sigma=sigma, switch_rate=switch_rate, lag=lag, adapt_rate=adapt_rate)
+        self.blink = FixedLagViterbi((open_threshold / 2, (1 + closed_threshold) / 2), **hmm)
+        self.gaze = FixedLagViterbi((-gaze_enter_threshold, 0.0, gaze_enter_threshold), **hmm)
+        self.up = FixedLagViterbi((gaze_up_exit_threshold / 2, gaze_up_enter_threshold * 1.5), **hmm)
+
+        # Committed state and when its segment started, per channel
+        self._blink_state, self._blink_start = self.OPEN, None
+        self._gaze_state = self.CENTER
+        self._up_state, self._up_start = self.LEVEL, None
+
+    # --- live state, as GestureDetector exposes it ---
+    @property
+    def eye_closed(self):
+        return self.blink.best_state() == self.CLOSED
+
+    @property
+    def looking_left(self):
+        return self.gaze.best_state() == self.LEFT
+
+    @property
+    def looking_right(self):
+        return self.gaze.best_state() == self.RIGHT
+
+    @property
+    def looking_up(self):
+        return self.up.best_state() == self.UP
+
+    def _filtered(self, name, value, timestamp):
+        return value if self.filters is None else self.filters[name].update(value, timestamp)
+
+    def _blink_events(self, committed):
+        if committed is None:
+            return []
+        state, _, timestamp = committed
+        events = []
+        if state != self._blink_state:
+            if state == self.CLOSED:
+                self._blink_start = timestamp
+            elif self._blink_start is not None:
+                duration = timestamp - self._blink_start
+                if duration > INVOLUNTARY_BLINK_DURATION:
+                    if duration < self.max_fast_blink_duration:
+                        events.append("FB")
+                    elif duration < self.max_slow_blink_duration:
+                        events.append("SB")
+                    else:
+                        events.append("VSB")
+                    if self.duration_model is not None:
+                        self.duration_model.observe(duration)
+                        self.max_fast_blink_duration, self.max_slow_blink_duration = \
+                            self.duration_model.boundaries()
+            self._blink_state = state
+        return events
+
+    def _gaze_events(self, committed):
+        if committed is None:
+            return []
+        state = committed[0]
+        events = []
+        if state != self._gaze_state:
+            if self._gaze_state == self.LEFT:
+                events.append("FL")
+            elif self._gaze_state == self.RIGHT:
+                events.append("FR")
+            self._gaze_state = state
+        return events
+
+    def _up_events(self, committed):
+        if committed is None:
+            return []
+        state, _, timestamp = committed
+        events = []
+        if state != self._up_state:
+            if state == self.UP:
+                self._up_start = timestamp
+            elif self._up_start is not None and timestamp - self._up_start < self.max_slow_gaze_duration:
+                events.append("FU")
+            self._up_state = state
+        return events
+
+    def update(
+        self,
+        left_blink, right_blink,
+        eye_look_in_left, eye_look_out_right,
+        eye_look_in_right, eye_look_out_left,
+        eyeLookUpLeft, eyeLookUpRight,
+        timestamp=None
+    ):
+        """Process one sample; returns the events whose segments were committed as ended."""
+        if timestamp is None:
+            timestamp = self.clock()
+
+        blink = self._filtered("blink", (left_blink + right_blink) / 2, timestamp)
+        gaze = self._filtered("gaze", (eye_look_out_left + eye_look_in_right) / 2
+                              - (eye_look_out_right + eye_look_in_left) / 2, timestamp)
+        up = self._filtered("up", (eyeLookUpLeft + eyeLookUpRight) / 2, timestamp)
+
+        return (
+            self._blink_events(self.blink.step(blink, timestamp))
+            + self._gaze_events(self.gaze.step(gaze, timestamp))
+            + self._up_events(self.up.step(up, timestamp))
+        )
@@ -0,0 +1,81 @@
+import numpy as np
+from app.utils.eye_gesture_detector import (
+    GESTURE_BLENDSHAPES,
+    LEFT_BLINK, RIGHT_BLINK,
+    LOOK_IN_LEFT, LOOK_OUT_RIGHT,
+    LOOK_IN_RIGHT, LOOK_OUT_LEFT,
+    LOOK_UP_LEFT, LOOK_UP_RIGHT,
+)
+
+# Face-mesh indices per eye, rows = (subject's left eye, subject's right eye):
+# outer corner, inner corner, two upper-lid points, the two lower-lid points
+# below them, iris centre
+EYE_POINTS = np.array([
+    (263, 362, 385, 387, 380, 373, 473),
+    (33, 133, 160, 158, 144, 153, 468),
+])
+OUTER, INNER, UPPER_A, UPPER_B, LOWER_A, LOWER_B, IRIS = range(EYE_POINTS.shape[1])
+_FLAT_POINTS = EYE_POINTS.ravel().tolist()
+_UP_SIGN = np.array([-1.0, 1.0], dtype=np.float32)
+
+
+class LandmarkSignals:
+    """
+    Gesture scores from face landmarks alone, for running the landmarker
+    without its blendshape head.
+
+    Blinks come from the eye aspect ratio (lid gap / corner distance), gaze
+    from where the iris centre sits between the eye corners and above their
+    midline. Both are mapped onto the 0-1 blendshape scale and written in
+    GESTURE_BLENDSHAPES order, so GestureDetector and its thresholds are
+    used unchanged.
+    """
+
+    def __init__(self, ear_open=0.28, ear_closed=0.10, gaze_gain=2.5, up_gain=4.0, up_offset=0.0):
+        self.ear_open = ear_open
+        self.ear_closed = ear_closed
+        self.gaze_gain = gaze_gain
+        self.up_gain = up_gain
+        self.up_offset = up_offset  # neutral iris height (eye widths above the corner line)
+        self.scores = np.zeros(len(GESTURE_BLENDSHAPES), dtype=np.float32)
+        self._points = np.empty((len(_FLAT_POINTS), 2), dtype=np.float32)
+
+    def fill(self, landmarks, aspect=1.0):
+        """
+        Write the scores for one face's landmarks into `self.scores`.
+        `aspect` is width / height of the image the landmarks are normalised
+        to, so distances are measured in square units.
+        """
+        points = self._points
+        for row, index in enumerate(_FLAT_POINTS):
+            landmark = landmarks[index]
+            points[row, 0] = landmark.x * aspect
+            points[row, 1] = landmark.y
+        eyes = points.reshape(EYE_POINTS.shape + (2,))
+
+        outer, inner = eyes[:, OUTER], eyes[:, INNER]
+        axis = inner - outer
+        width = np.maximum(np.hypot(axis[:, 0], axis[:, 1]), 1e-6)
+
+        # Eye aspect ratio -> blink score (0 open .. 1 closed)
+        gaps = np.hypot(*(eyes[:, UPPER_A:UPPER_B + 1] - eyes[:, LOWER_A:LOWER_B + 1]).transpose(2, 0, 1))
+        ear = gaps.mean(axis=1) / width
+        blink = np.clip((self.ear_open - ear) / (self.ear_open - self.ear_closed), 0.0, 1.0)
+
+        # Iris position along the corner axis: -1 at the outer corner, +1 at the inner
+        iris = eyes[:, IRIS] - (outer + inner) / 2
+        along = (iris * axis).sum(axis=1) / (width * width) * 2
+        look_in = np.clip(along * self.gaze_gain, 0.0, 1.0)
+        look_out = np.clip(-along * self.gaze_gain, 0.0, 1.0)
+
+        # Iris height above the corner line in eye widths. The axes of the two
+        # eyes point opposite ways, so the cross product's sign is flipped for one
+        across = (iris[:, 0] * axis[:, 1] - iris[:, 1] * axis[:, 0]) / (width * width) * _UP_SIGN
+        up = np.clip((across - self.up_offset) * self.up_gain, 0.0, 1.0)
+
+        scores = self.scores
+        scores[LEFT_BLINK], scores[RIGHT_BLINK] = blink
+        scores[LOOK_IN_LEFT], scores[LOOK_IN_RIGHT] = look_in
+        scores[LOOK_OUT_LEFT], scores[LOOK_OUT_RIGHT] = look_out
+        scores[LOOK_UP_LEFT], scores[LOOK_UP_RIGHT] = up
+        return scores
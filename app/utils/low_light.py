@@ -0,0 +1,86 @@
+import math
+
+import cv2
+import numpy as np
+
+from app.utils.roi_tracker import landmark_box
+
+
+class LowLightEnhancer:
+    """
+    Brightens the face region of dark frames before they reach the landmarker.
+
+    Brightness is the median of a 32-bin histogram of the green channel,
+    sampled every `sample_step` pixels over the last known face box (the whole
+    frame until a face is found). Below `threshold` (0-255) the face box --
+    not the rest of the frame -- is enhanced in place, either with a gamma
+    curve that lifts the median towards `target` or with CLAHE on the
+    lightness channel.
+    """
+
+    def __init__(self, threshold=60, mode="gamma", target=110, clip_limit=2.0, padding=0.15, sample_step=8):
+        self.threshold = threshold
+        self.mode = mode
+        self.target = target
+        self.padding = padding
+        self.sample_step = sample_step
+        self.face_box = None  # (x0, y0, x1, y1) in full-frame pixels
+        self.brightness = None
+        self.enhanced = 0
+        self._luts = {}
+        self._clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=(4, 4)) if mode == "clahe" else None
+
+    def measure(self, image):
+        """Median brightness (0-255) from a downsampled histogram of `image`."""
+        sample = image[::self.sample_step, ::self.sample_step, 1]
+        histogram = np.bincount(sample.ravel() >> 3, minlength=32)
+        median_bin = int(np.searchsorted(np.cumsum(histogram), sample.size / 2))
+        return median_bin * 8 + 4
+
+    def _gamma_lut(self, brightness):
+        # Quantised so a handful of tables covers every frame
+        gamma = round(math.log(self.target / 255) / math.log(max(brightness, 1) / 255), 1)
+        lut = self._luts.get(gamma)
+        if lut is None:
+            lut = ((np.arange(256) / 255.0) ** gamma * 255).clip(0, 255).astype(np.uint8)
+            self._luts[gamma] = lut
+        return lut
+
+    def process(self, rgb, region):
+        """
+        Enhance the face box inside `rgb` (an RGB image of the frame area
+        `region` = (x0, y0, x1, y1)) if it is dark. Returns True if it was.
+        """
+        rx0, ry0, rx1, ry1 = region
+        if self.face_box is not None:
+            x0, y0, x1, y1 = self.face_box
+            x0, y0 = max(x0 - rx0, 0), max(y0 - ry0, 0)
+            x1, y1 = min(x1 - rx0, rgb.shape[1]), min(y1 - ry0, rgb.shape[0])
+            if x1 <= x0 or y1 <= y0:
+                return False
+            face = rgb[y0:y1, x0:x1]
+        else:
+            face = rgb
+
+        self.brightness = self.measure(face)
+        if self.brightness >= self.threshold:
+            return False
+
+        if self._clahe is not None:
+            lab = cv2.cvtColor(face, cv2.COLOR_RGB2LAB)
+            lab[:, :, 0] = self._clahe.apply(np.ascontiguousarray(lab[:, :, 0]))
+            face[...] = cv2.cvtColor(lab, cv2.COLOR_LAB2RGB)
+        else:
+            face[...] = cv2.LUT(face, self._gamma_lut(self.brightness))
+        self.enhanced += 1
+        return True
+
+    def track(self, result, region, frame_shape):
+        """Update the face box from `result`, whose landmarks refer to `region`."""
+        if not result.face_landmarks:
+            self.face_box = None
+            return
+
+        self.face_box = landmark_box(
+            result.face_landmarks[0], region, frame_shape, padding=(self.padding, self.padding)
+        )
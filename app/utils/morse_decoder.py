@@ -14,7 +14,7 @@ MORSE_TO_ALPHA = {
 def morse_to_letter(buffer):
     return MORSE_TO_ALPHA.get(buffer, '')  # '' if not a valid Morse code
 
-def event_to_letter(event, buffer, string):
+def event_to_letter(event, buffer, string, say=speak):
     if event:
         match event:
             case "FB": 
@@ -30,10 +30,14 @@ def event_to_letter(event, buffer, string):
                 elif tmp == "delete":
                     string = ""
                 elif tmp == "play":
-                    speak(string)
+                    say(string)
                 elif tmp == "chat":
-                    from app.chat_ui import DrishtiAIUI
                     import app.utils.global_state as gs
+                    if gs.headless:
+                        # No Tk in the daemon; clients open their own chat view
+                        return buffer, string
+
+                    from app.chat_ui import DrishtiAIUI
 
                     if gs.main_ui:
                         gs.main_ui.withdraw()  # hide main window
@@ -47,6 +51,11 @@ def event_to_letter(event, buffer, string):
 
                     chat_app.protocol("WM_DELETE_WINDOW", on_close)
                     chat_app.wait_window()  # block until chat window is closed
+
+                    if gs.main_ui:
+                        # Gestures made in the chat window were meant for it,
+                        # not for the keyboard's queue
+                        gs.main_ui.datas.gestures.clear()
                 else:
                     string += tmp
             case "FL": 
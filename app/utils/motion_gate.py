@@ -0,0 +1,80 @@
+import numpy as np
+
+from app.utils.roi_tracker import landmark_box
+
+# Face-mesh landmarks outlining both eyes (corners, lids) and the irises
+EYE_LANDMARKS = (
+    33, 133, 159, 145, 160, 144, 158, 153,      # right eye (image left)
+    362, 263, 386, 374, 385, 380, 387, 373,     # left eye (image right)
+    468, 473,                                   # iris centres
+)
+
+
+class MotionGate:
+    """
+    Cheap pre-filter in front of the landmarker.
+
+    Compares a downsampled green channel of the last known eye region with the
+    same region of the last inferred frame. While the mean absolute change
+    stays below `threshold` (0-255 scale) inference is skipped, except that a
+    refresh is forced every `refresh_ms` so slow drifts are still caught.
+    """
+
+    def __init__(self, threshold=3.0, refresh_ms=300, padding=0.5, sample_step=4):
+        self.threshold = threshold
+        self.refresh = refresh_ms / 1000
+        self.padding = padding
+        self.sample_step = sample_step
+        self.eye_box = None  # (x0, y0, x1, y1) in full-frame pixels
+        self._reference = None
+        self._reference_time = None
+        self.last_change = None
+        self.skipped = 0
+
+    def _sample(self, image):
+        x0, y0, x1, y1 = self.eye_box
+        step = self.sample_step
+        return image[y0:y1:step, x0:x1:step, 1].astype(np.int16)
+
+    def should_infer(self, image, timestamp):
+        """False when the eye region hasn't changed since the last inferred frame."""
+        if self.eye_box is None or self._reference is None:
+            return True
+        if timestamp - self._reference_time >= self.refresh:
+            return True
+
+        sample = self._sample(image)
+        if sample.shape != self._reference.shape:
+            return True
+        self.last_change = float(np.abs(sample - self._reference).mean())
+        if self.last_change >= self.threshold:
+            return True
+
+        self.skipped += 1
+        return False
+
+    def mark_inferred(self, image, timestamp):
+        """Remember `image` as the reference the next frames are compared with."""
+        if self.eye_box is None:
+            self._reference = None
+            return
+        self._reference = self._sample(image)
+        self._reference_time = timestamp
+
+    def track(self, result, region, frame_shape):
+        """Update the eye box from `result`, whose landmarks refer to `region`."""
+        if not result.face_landmarks:
+            self.eye_box = None
+            self._reference = None
+            return
+
+        landmarks = result.face_landmarks[0]
+        if len(landmarks) <= max(EYE_LANDMARKS):
+            self.eye_box = None
+            return
+        # Eyes are wide and flat: pad less sideways, and keep some height
+        # around closed lids
+        self.eye_box = landmark_box(
+            landmarks, region, frame_shape, padding=(self.padding / 2, self.padding), min_pad=4,
+            indices=EYE_LANDMARKS
+        )
@@ -0,0 +1,144 @@
+# -------------------------------------------------------------------
+# P² QUANTILE ESTIMATOR
+# -------------------------------------------------------------------
+class P2Quantile:
+    """
+    Running estimate of the `p` quantile in five numbers (Jain & Chlamtac's
+    P² algorithm): marker heights are nudged with a parabolic fit as samples
+    arrive, so memory and per-sample cost are constant.
+    """
+
+    def __init__(self, p):
+        self.p = p
+        self.count = 0
+        self.heights = []
+        self.positions = [0, 1, 2, 3, 4]
+        self.desired = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x):
+        self.count += 1
+        q = self.heights
+        if len(q) < 5:
+            q.append(x)
+            q.sort()
+            return
+
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        n = self.positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        for i in (1, 2, 3):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                candidate = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not q[i - 1] < candidate < q[i + 1]:
+                    candidate = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = candidate
+                n[i] += d
+
+    def value(self):
+        if not self.heights:
+            return None
+        if len(self.heights) < 5:
+            index = min(int(self.p * len(self.heights)), len(self.heights) - 1)
+            return self.heights[index]
+        return self.heights[2]
+
+
+class WindowedQuantile:
+    """
+    P² estimate that forgets: a fresh estimator is started every `window`
+    samples and the previous one answers until the new one has half a
+    window, so the quantile follows a changed camera position within about
+    one window.
+    """
+
+    def __init__(self, p, window):
+        self.p = p
+        self.window = window
+        self.current = P2Quantile(p)
+        self.previous = None
+
+    def add(self, x):
+        self.current.add(x)
+        if self.current.count >= self.window:
+            self.previous, self.current = self.current, P2Quantile(self.p)
+
+    def value(self):
+        if self.previous is not None and self.current.count < self.window // 2:
+            return self.previous.value()
+        if self.current.count < 5:
+            return None
+        return self.current.value()
+
+
+# -------------------------------------------------------------------
+# THRESHOLDS FROM QUANTILES
+# -------------------------------------------------------------------
+class QuantileThresholds:
+    """
+    Derives GestureDetector's hysteresis thresholds from running quantiles,
+    in memory and on every sample.
+
+    For each signal (blink, horizontal gaze, up gaze) it tracks the `low_p`
+    quantile of the scores while the gesture is held and the `high_p`
+    quantile while it isn't (the resting noise ceiling; `high_p` stays well
+    below 1 so missed gestures counted as resting can't lift it). With the gap
+    between them, the exit threshold is set at `exit_at` and the enter
+    threshold at `enter_at` of the way up from the ceiling. If the held
+    scores come within `min_gap` of the ceiling the gap is taken to be
+    `min_gap`, which puts both thresholds just above the resting level.
+
+    A gesture "held" for longer than `max_hold` seconds is no gesture at all
+    but thresholds the user's resting level no longer crosses (e.g. after the
+    camera moved); the caller reports those samples as resting so the
+    estimates can recover.
+    """
+
+    def __init__(self, window=300, engaged_window=60, low_p=0.1, high_p=0.8,
+                 exit_at=0.3, enter_at=0.6, min_gap=0.1, max_hold=2.0):
+        self.max_hold = max_hold
+        self.exit_at = exit_at
+        self.enter_at = enter_at
+        self.min_gap = min_gap
+        self.channels = {
+            name: (WindowedQuantile(high_p, window), WindowedQuantile(low_p, engaged_window))
+            for name in ("blink", "gaze", "up")
+        }
+
+    def observe(self, name, value, engaged, exit_threshold):
+        """
+        Add a sample of signal `name` taken with the gesture held or not.
+        The sample that ends a gesture (below `exit_threshold`) belongs to
+        neither distribution and is skipped. Returns (exit_threshold,
+        enter_threshold) or None if not yet known.
+        """
+        resting, held = self.channels[name]
+        if not engaged:
+            resting.add(value)
+        elif value >= exit_threshold:
+            held.add(value)
+
+        ceiling, floor = resting.value(), held.value()
+        if ceiling is None or floor is None:
+            return None
+        gap = max(floor - ceiling, self.min_gap)
+        return ceiling + self.exit_at * gap, ceiling + self.enter_at * gap
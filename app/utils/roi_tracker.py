@@ -0,0 +1,82 @@
+import numpy as np
+
+
+def landmark_box(landmarks, region, frame_shape, padding=(0.0, 0.0), min_pad=0.0, indices=None):
+    """
+    Full-frame pixel box (x0, y0, x1, y1) around `landmarks`, whose normalised
+    coordinates refer to `region` of a frame of `frame_shape`. Each side is
+    padded by `padding` (x, y fractions of the box size) but at least
+    `min_pad` pixels, then clipped to the frame. Only the landmarks at
+    `indices` are used if given. None if the box is empty.
+    """
+    if indices is not None:
+        landmarks = [landmarks[i] for i in indices]
+    count = len(landmarks)
+    xs = np.fromiter((p.x for p in landmarks), dtype=np.float32, count=count)
+    ys = np.fromiter((p.y for p in landmarks), dtype=np.float32, count=count)
+
+    rx0, ry0, rx1, ry1 = region
+    rw, rh = rx1 - rx0, ry1 - ry0
+    x_min, x_max = rx0 + float(xs.min()) * rw, rx0 + float(xs.max()) * rw
+    y_min, y_max = ry0 + float(ys.min()) * rh, ry0 + float(ys.max()) * rh
+    pad_x = max((x_max - x_min) * padding[0], min_pad)
+    pad_y = max((y_max - y_min) * padding[1], min_pad)
+
+    h, w = frame_shape[:2]
+    x0, y0 = max(0, int(x_min - pad_x)), max(0, int(y_min - pad_y))
+    x1, y1 = min(w, int(x_max + pad_x)), min(h, int(y_max + pad_y))
+    return (x0, y0, x1, y1) if x1 > x0 and y1 > y0 else None
+
+
+class RoiTracker:
+    """
+    Crops each frame around the face found in the previous landmarker result.
+
+    The crop is the landmark bounding box padded on every side by `padding`
+    (a fraction of the box size). A full frame is used whenever no face is
+    tracked, and every `refresh_interval` frames so a face that moved out of
+    the crop is found again.
+    """
+
+    def __init__(self, padding=0.25, refresh_interval=30, min_size=64):
+        self.padding = padding
+        self.refresh_interval = refresh_interval
+        self.min_size = min_size
+        self.box = None  # (x0, y0, x1, y1) in full-frame pixels
+        self.frames_since_full = 0
+
+    def crop(self, image):
+        """
+        Returns (image_region, region) where region = (x0, y0, x1, y1) is the
+        part of the full frame that was kept.
+        """
+        h, w = image.shape[:2]
+        if self.box is None or self.frames_since_full >= self.refresh_interval:
+            self.frames_since_full = 0
+            return image, (0, 0, w, h)
+
+        self.frames_since_full += 1
+        x0, y0, x1, y1 = self.box
+        return image[y0:y1, x0:x1], self.box
+
+    def update(self, result, region, frame_shape):
+        """
+        Track the face in `result`, whose normalised landmarks refer to
+        `region` of a frame of `frame_shape`.
+        """
+        if not result.face_landmarks:
+            self.box = None
+            return
+
+        box = landmark_box(
+            result.face_landmarks[0], region, frame_shape,
+            padding=(self.padding, self.padding), min_pad=self.min_size / 2
+        )
+        if box is None or box[2] - box[0] < self.min_size or box[3] - box[1] < self.min_size:
+            self.box = None
+        else:
+            self.box = box
+
+    def reset(self):
+        self.box = None
+        self.frames_since_full = 0
@@ -0,0 +1,94 @@
+import math
+
+# Constant-time per-sample smoothers for the detector's combined scores.
+# Each keeps only its last state and update(value, timestamp) returns the
+# filtered value. EMA and One-Euro derive their smoothing factor from the
+# actual interval between sample timestamps, so a dropped or slow frame is
+# weighted for the time it really covers.
+
+
+def _alpha(dt, cutoff_hz):
+    """Smoothing factor of a first-order low-pass with `cutoff_hz` over `dt` seconds."""
+    tau = 1.0 / (2 * math.pi * cutoff_hz)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class EmaFilter:
+    """Exponential moving average with time constant `tau` seconds."""
+
+    def __init__(self, tau=0.05):
+        self.tau = tau
+        self.value = None
+        self.timestamp = None
+
+    def update(self, value, timestamp):
+        if self.value is None:
+            self.value, self.timestamp = value, timestamp
+            return value
+        dt = timestamp - self.timestamp
+        if dt <= 0:
+            return self.value
+        a = 1.0 - math.exp(-dt / self.tau)
+        self.value += a * (value - self.value)
+        self.timestamp = timestamp
+        return self.value
+
+
+class OneEuroFilter:
+    """
+    One-Euro filter (Casiez et al.): heavy smoothing while the score is
+    steady, a cutoff that rises with its speed so real blinks aren't delayed.
+    """
+
+    def __init__(self, min_cutoff=3.0, beta=0.5, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.value = None
+        self.speed = 0.0
+        self.timestamp = None
+
+    def update(self, value, timestamp):
+        if self.value is None:
+            self.value, self.timestamp = value, timestamp
+            return value
+        dt = timestamp - self.timestamp
+        if dt <= 0:
+            return self.value
+        a_d = _alpha(dt, self.d_cutoff)
+        self.speed += a_d * ((value - self.value) / dt - self.speed)
+        a = _alpha(dt, self.min_cutoff + self.beta * abs(self.speed))
+        self.value += a * (value - self.value)
+        self.timestamp = timestamp
+        return self.value
+
+
+class Median3Filter:
+    """Median of the last three samples: removes single-frame spikes outright."""
+
+    def __init__(self):
+        self.a = self.b = None
+
+    def update(self, value, timestamp):
+        a, b = self.a, self.b
+        self.a, self.b = b, value
+        if a is None:
+            return value
+        return max(min(a, b), min(max(a, b), value))
+
+
+FILTERS = {
+    "ema": EmaFilter,
+    "one_euro": OneEuroFilter,
+    "median3": Median3Filter,
+}
+
+
+def make_filter_factory(kind, **params):
+    """Callable creating a fresh filter of `kind`, or None for "none"."""
+    kind = str(kind or "none").lower()
+    if kind == "none":
+        return None
+    if kind not in FILTERS:
+        raise ValueError(f"Unknown signal filter '{kind}'")
+    return lambda: FILTERS[kind](**params)
@@ -1,4 +1,6 @@
 from io import BytesIO
+import queue
+import threading
 import pygame
 from groq import Groq
 from dotenv import load_dotenv
@@ -56,6 +58,34 @@ def speak(text: str, voice: str = "Jennifer-PlayAI"):
         pygame.mixer.quit()
 
 
+# =============================
+# SHARED PLAYER
+# =============================
+class SpeechQueue:
+    """
+    Speaks texts one after another on its own thread. For callers that must
+    not block on TTS (ward sessions stepped by worker threads) and that would
+    otherwise fight over the one pygame mixer.
+    """
+
+    def __init__(self, voice: str = "Jennifer-PlayAI"):
+        self.voice = voice
+        self.queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="drishti-speech", daemon=True)
+        self._thread.start()
+
+    def say(self, text: str):
+        if text.strip():
+            self.queue.put(text)
+
+    def _run(self):
+        while (text := self.queue.get()) is not None:
+            speak(text, self.voice)
+
+    def close(self):
+        self.queue.put(None)
+
+
 # =============================
 # TEST
 # =============================
@@ -85,11 +85,18 @@ class Trie:
 
 
 # ------------------ Initialization ------------------
-user_cache_raw = load_json(CACHE_FILE, {})
-user_cache = defaultdict(Counter)
-for k, v in user_cache_raw.items():
-    user_cache[k] = Counter(v)
-user_cache.setdefault("words", Counter())
+def load_user_cache(path=CACHE_FILE):
+    """Load a personalised word-frequency cache (one per user)."""
+    user_cache_raw = load_json(path, {})
+    cache = defaultdict(Counter)
+    for k, v in user_cache_raw.items():
+        cache[k] = Counter(v)
+    cache.setdefault("words", Counter())
+    return cache
+
+
+# Default user's cache; sessions for other users pass their own
+user_cache = load_user_cache()
 
 adaptive_corpus = load_json(CORPUS_FILE, [])
 
@@ -129,13 +136,14 @@ Example: time, tiny, tire
 
 
 # ------------------ Core Suggestion ------------------
-def get_suggestions(prefix, top_n=4):
+def get_suggestions(prefix, top_n=4, cache=None):
     """Return up to 4 distinct word suggestions for given prefix."""
+    cache = user_cache if cache is None else cache
     prefix = prefix.lower()
     suggestions = Counter()
 
     # 1️⃣ Personalized suggestions
-    for w, c in user_cache["words"].items():
+    for w, c in cache["words"].items():
         if w.startswith(prefix):
             suggestions[w] += c * 10
 
@@ -169,16 +177,17 @@ def get_suggestions(prefix, top_n=4):
 
 
 # ------------------ Update User Cache ------------------
-def update_user_cache(context_or_word, next_word=None):
+def update_user_cache(context_or_word, next_word=None, cache=None, cache_file=CACHE_FILE):
     """Update personalized word frequency safely."""
+    cache = user_cache if cache is None else cache
     try:
         if next_word:
             key = "|".join(context_or_word) if isinstance(context_or_word, (list, tuple)) else str(context_or_word)
-            user_cache[key][next_word] += 1
-            user_cache["words"][next_word] += 1
+            cache[key][next_word] += 1
+            cache["words"][next_word] += 1
         else:
             word = context_or_word
-            user_cache["words"][word] += 1
+            cache["words"][word] += 1
 
         word_to_add = next_word or context_or_word
         if word_to_add not in adaptive_corpus:
@@ -186,13 +195,13 @@ def update_user_cache(context_or_word, next_word=None):
             trie.insert(word_to_add)
             save_json(CORPUS_FILE, adaptive_corpus)
 
-        save_json(CACHE_FILE, serialize_user_cache(user_cache))
+        save_json(cache_file, serialize_user_cache(cache))
     except Exception as e:
         print("⚠️ update_user_cache error:", e)
 
 
 # ------------------ Unified Suggest ------------------
-def suggest(user_input):
+def suggest(user_input, cache=None):
     """Returns -> (prefix_suggestions, []) — stops on space."""
     if not user_input or not user_input.strip():
         return ["", "", "", ""], []
@@ -201,7 +210,7 @@ def suggest(user_input):
         return ["", "", "", ""], []
 
     prefix = user_input.split()[-1].lower()
-    prefix_suggestions = get_suggestions(prefix, top_n=4)
+    prefix_suggestions = get_suggestions(prefix, top_n=4, cache=cache)
     return prefix_suggestions, []
 
 
@@ -0,0 +1,100 @@
+"""
+Lightweight per-stage tracing of the frame pipeline.
+
+Enable with DRISHTI_TRACE=1 (written to cache/drishti_trace.json at exit) or
+DRISHTI_TRACE=path/to/trace.json. Spans go into a fixed-size ring buffer and
+are exported as Chrome trace_event JSON (open in chrome://tracing or Perfetto).
+When disabled, span() returns a shared no-op context manager.
+
+    with span("detector.detect", seq=frame.seq):
+        result = detector.detect(mp_image)
+"""
+import atexit
+import json
+import os
+import signal
+import threading
+from collections import deque
+from pathlib import Path
+from time import perf_counter
+
+TRACE_ENV_VAR = "DRISHTI_TRACE"
+TRACE_SIZE_ENV_VAR = "DRISHTI_TRACE_SIZE"
+DEFAULT_TRACE_PATH = Path("cache/drishti_trace.json")
+
+_setting = os.environ.get(TRACE_ENV_VAR, "")
+enabled = _setting not in ("", "0")
+trace_path = DEFAULT_TRACE_PATH if _setting in ("", "0", "1") else Path(_setting)
+
+# (name, thread id, start, end, args) -- oldest spans fall off the end
+_spans = deque(maxlen=int(os.environ.get(TRACE_SIZE_ENV_VAR, 200_000)))
+_thread_names = {}
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = perf_counter()
+        tid = threading.get_ident()
+        if tid not in _thread_names:
+            _thread_names[tid] = threading.current_thread().name
+        _spans.append((self.name, tid, self.start, end, self.args))
+        return False
+
+
+def span(name, **args):
+    """Context manager timing one pipeline stage (no-op unless tracing is on)."""
+    if not enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def dump_trace(path=None):
+    """Write the buffered spans as Chrome trace_event JSON. Returns the path."""
+    path = Path(path or trace_path)
+    pid = os.getpid()
+
+    events = [
+        {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+        for tid, name in list(_thread_names.items())
+    ]
+    for name, tid, start, end, args in list(_spans):
+        events.append({
+            "name": name, "ph": "X", "pid": pid, "tid": tid,
+            "ts": start * 1e6, "dur": (end - start) * 1e6, "args": args,
+        })
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    print(f"[trace] Wrote {len(events)} events to {path}")
+    return path
+
+
+if enabled:
+    atexit.register(dump_trace)
+    # `kill -USR1 <pid>` dumps a snapshot of a running session
+    if hasattr(signal, "SIGUSR1") and threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGUSR1, lambda signum, frame: dump_trace())
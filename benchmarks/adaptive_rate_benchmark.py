@@ -0,0 +1,84 @@
+"""
+What the adaptive frame-rate scheduler saves, and what it costs in accuracy.
+
+Replays a recorded blendshape stream (see replay_benchmark) once at the full
+recorded rate and once through AdaptiveRateScheduler, where a skipped frame
+reuses the last sampled scores exactly as VisionEngine does. Reports the share
+of landmarker runs saved, the CPU / power that corresponds to at a given
+per-frame landmarker cost, and per-class agreement for FB / SB / VSB:
+    python -m benchmarks.adaptive_rate_benchmark cache/recordings/session.npy
+    python -m benchmarks.adaptive_rate_benchmark session.npy --idle-fps 6 --landmarker-ms 18 --cpu-watts 15
+    python -m benchmarks.adaptive_rate_benchmark --synthetic 300
+"""
+import argparse
+
+from app.utils.blendshape_recorder import load_recording, replay
+from app.utils.frame_rate_scheduler import AdaptiveRateScheduler
+from benchmarks.common import load_config, create_detector, match_events, synthetic_trace, BLINK_CLASSES
+
+
+
+def replay_scheduled(timestamps, scores, detector, scheduler):
+    """Like replay(), but only scheduled samples refresh the scores."""
+    events = []
+    current = scores[0]
+    for timestamp, row in zip(timestamps.tolist(), scores):
+        if scheduler.should_sample(timestamp, detector, True, current):
+            current = row
+        for event in detector.update_scores(current, timestamp):
+            events.append((timestamp, event))
+    return events
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording", nargs="?", help=".npy file written by BlendshapeRecorder")
+    parser.add_argument("--synthetic", type=float, default=None, metavar="SECONDS",
+                        help="use a simulated session of this length instead of a recording")
+    parser.add_argument("--idle-fps", type=float, default=10)
+    parser.add_argument("--idle-after", type=float, default=1.0)
+    parser.add_argument("--landmarker-ms", type=float, default=15.0, help="CPU cost of one landmarker run")
+    parser.add_argument("--cpu-watts", type=float, default=10.0, help="package power while inferring")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="event match window (s)")
+    args = parser.parse_args()
+    if args.recording is None and args.synthetic is None:
+        parser.error("give a recording or --synthetic SECONDS")
+
+    if args.synthetic is not None:
+        timestamps, scores, _ = synthetic_trace(args.synthetic)
+    else:
+        timestamps, scores = load_recording(args.recording)
+    if len(timestamps) == 0:
+        print("[bench] Recording is empty.")
+        return
+    session_seconds = float(timestamps[-1] - timestamps[0]) or 1.0
+    cfg = load_config()
+
+    baseline = replay(timestamps, scores, create_detector(cfg))
+    scheduler = AdaptiveRateScheduler(idle_fps=args.idle_fps, idle_after=args.idle_after)
+    scheduled = replay_scheduled(timestamps, scores, create_detector(cfg), scheduler)
+
+    frames = len(timestamps)
+    saved = scheduler.skipped / frames
+    cpu_saved = scheduler.skipped * args.landmarker_ms / 1000
+    print(f"[bench] samples      : {frames} over {session_seconds:.1f} s "
+          f"({frames / session_seconds:.1f} fps recorded)")
+    print(f"[bench] landmarker   : {scheduler.sampled} runs, {scheduler.skipped} skipped ({saved * 100:.0f}%)")
+    print(f"[bench] CPU saved    : {cpu_saved:.1f} s ({cpu_saved / session_seconds * 100:.1f}% of a core), "
+          f"~{cpu_saved / session_seconds * args.cpu_watts:.2f} W at {args.cpu_watts:.0f} W")
+
+    matched, missed, extra = match_events(baseline, scheduled, args.tolerance)
+    for name in BLINK_CLASSES:
+        reference = sum(1 for _, event in baseline if event == name)
+        hits = sum(1 for (_, event), _ in matched if event == name)
+        lost = sum(1 for _, event in missed if event == name)
+        added = sum(1 for _, event in extra if event == name)
+        accuracy = hits / reference * 100 if reference else 100.0
+        print(f"[bench] {name:<4}         : {hits}/{reference} matched ({accuracy:.0f}%), "
+              f"{lost} missed, {added} extra")
+    others = [e for e in missed + extra if e[1] not in BLINK_CLASSES]
+    print(f"[bench] gaze events  : {len(others)} differences")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+How quantile-derived thresholds follow a camera move that fixed ones miss.
+
+Simulates a blink score trace whose resting and closed levels jump halfway
+through (the camera or the lighting changed: resting 0.08 -> 0.30, closed
+0.85 -> 0.62). The trace is replayed through GestureDetector with the
+thresholds from config.yaml and with a QuantileThresholds tracker. Reports the
+blinks found before and after the jump, when the first one after it is
+detected, the final thresholds and the CPU cost per sample:
+    python -m benchmarks.adaptive_threshold_benchmark
+    python -m benchmarks.adaptive_threshold_benchmark --seconds 600 --seeds 10
+"""
+import argparse
+from time import process_time
+
+import numpy as np
+
+from app.utils.blendshape_recorder import replay
+from app.utils.eye_gesture_detector import GESTURE_BLENDSHAPES, LEFT_BLINK, RIGHT_BLINK
+from app.utils.quantile_thresholds import QuantileThresholds
+from benchmarks.common import load_config, create_detector
+
+FPS = 30
+
+
+def simulate(rng, seconds):
+    """(timestamps, scores, blink start times, time of the jump)."""
+    n = int(seconds * FPS)
+    shift = n // 2
+    timestamps = np.arange(n) / FPS
+    resting = np.where(np.arange(n) < shift, 0.08, 0.30)
+    closed = np.where(np.arange(n) < shift, 0.85, 0.62)
+    blink = resting + rng.normal(0, 0.03, n)
+    starts, i = [], 20
+    while i < n - 40:
+        length = int(rng.integers(5, 12))
+        blink[i:i + length] = closed[i] + rng.normal(0, 0.03, length)
+        starts.append(timestamps[i])
+        i += length + int(rng.integers(30, 60))
+
+    scores = np.clip(rng.normal(0.1, 0.03, (n, len(GESTURE_BLENDSHAPES))), 0, 1).astype(np.float32)
+    scores[:, LEFT_BLINK] = scores[:, RIGHT_BLINK] = np.clip(blink, 0, 1)
+    return timestamps, scores, starts, timestamps[shift]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=200, help="length of each simulated trace")
+    parser.add_argument("--seeds", type=int, default=5, help="number of simulated traces")
+    args = parser.parse_args()
+
+    cfg = load_config()
+    for seed in range(args.seeds):
+        timestamps, scores, starts, shift = simulate(np.random.default_rng(seed), args.seconds)
+        before = sum(t < shift for t in starts)
+        after = len(starts) - before
+        for name in ("fixed", "adaptive"):
+            detector = create_detector(dict(cfg, detector_engine="threshold", signal_filter="none"))
+            if name == "adaptive":
+                detector.threshold_tracker = QuantileThresholds(
+                    window=cfg.get("adaptive_threshold_window", 300),
+                    engaged_window=cfg.get("adaptive_threshold_engaged_window", 60),
+                )
+            start = process_time()
+            events = replay(timestamps, scores, detector)
+            cpu = process_time() - start
+
+            blinks = [t for t, e in events if e in ("FB", "SB", "VSB")]
+            found_after = [t for t in blinks if t >= shift]
+            recovered = f"{found_after[0] - shift:.1f} s" if found_after else "never"
+            print(f"[bench] seed {seed} {name:<8}: {len(blinks) - len(found_after)}/{before} before, "
+                  f"{len(found_after)}/{after} after the jump, first after {recovered}, "
+                  f"thresholds {detector.open_threshold:.2f} / {detector.closed_threshold:.2f}, "
+                  f"{cpu / len(timestamps) * 1e6:.1f} us CPU/sample")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Probe what a webcam negotiates and how much capture lag it adds.
+
+With no options the camera settings from cache/config.yaml are used; any
+option overrides them, so formats can be compared per site before editing
+the config:
+    python -m benchmarks.camera_probe
+    python -m benchmarks.camera_probe --fourcc MJPG --width 640 --height 480 --fps 30 --buffer-size 1
+    python -m benchmarks.camera_probe --camera 1 --frames 120
+"""
+import argparse
+
+from app.core.eye_gesture import load_config
+from app.utils.frame_sources import WebcamSource, camera_settings, probe_capture, format_probe
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--camera", type=int, default=0, help="camera index")
+    parser.add_argument("--fourcc", help="e.g. MJPG, YUYV")
+    parser.add_argument("--width", type=int)
+    parser.add_argument("--height", type=int)
+    parser.add_argument("--fps", type=float)
+    parser.add_argument("--buffer-size", type=int)
+    parser.add_argument("--frames", type=int, default=60, help="frames timed in steady state")
+    args = parser.parse_args()
+
+    settings = camera_settings(load_config())
+    for key in ("fourcc", "width", "height", "fps", "buffer_size"):
+        if getattr(args, key) is not None:
+            settings[key] = getattr(args, key)
+    print("[bench] requested : " + ", ".join(f"{k}={v}" for k, v in settings.items() if v))
+
+    source = WebcamSource(args.camera, settings=settings)
+    try:
+        report = probe_capture(source, frames=args.frames)
+    finally:
+        source.release()
+
+    print(f"[bench] negotiated: {format_probe(report)}")
+    if report["read_ms"] is not None:
+        print(f"[bench] read()    : {report['read_ms']:.1f} ms median")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Helpers shared by the benchmark scripts."""
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+
+from app.core.eye_gesture import load_config, create_gesture_detector, MODEL_PATH
+from app.utils.eye_gesture_detector import (
+    GESTURE_BLENDSHAPES,
+    LEFT_BLINK, RIGHT_BLINK,
+    LOOK_IN_LEFT, LOOK_OUT_RIGHT,
+    LOOK_IN_RIGHT, LOOK_OUT_LEFT,
+)
+
+
+def create_detector(cfg=None):
+    """GestureDetector with the thresholds from config.yaml."""
+    return create_gesture_detector(cfg or load_config())
+
+
+def create_landmarker(model_path=MODEL_PATH, blendshapes=True):
+    """IMAGE-mode FaceLandmarker (imports MediaPipe on first use)."""
+    import mediapipe as mp
+
+    vision = mp.tasks.vision
+    options = vision.FaceLandmarkerOptions(
+        base_options=mp.tasks.BaseOptions(model_asset_path=model_path),
+        running_mode=vision.RunningMode.IMAGE,
+        num_faces=1,
+        output_face_blendshapes=blendshapes
+    )
+    return vision.FaceLandmarker.create_from_options(options)
+
+
+def to_mp_image(image_bgr):
+    import cv2
+    import mediapipe as mp
+
+    frame_rgb = cv2.cvtColor(image_bgr, cv2.COLOR_BGR2RGB)
+    return mp.Image(image_format=mp.ImageFormat.SRGB, data=frame_rgb)
+
+
+def event_digest(events):
+    """Stable digest of a [(timestamp, event), ...] sequence."""
+    h = hashlib.sha1()
+    for timestamp, event in events:
+        h.update(f"{timestamp!r}:{event};".encode())
+    return h.hexdigest()
+
+
+def match_events(reference, candidate, tolerance=0.25):
+    """
+    Pair events of the same name whose timestamps are within `tolerance` s.
+    Returns (matched, missed, extra) where `missed` are reference events with
+    no partner and `extra` are unmatched candidate events; `matched` holds
+    (reference, candidate) pairs.
+    """
+    unused = list(candidate)
+    matched, missed = [], []
+    for ref in reference:
+        partner = next(
+            (c for c in unused if c[1] == ref[1] and abs(c[0] - ref[0]) <= tolerance), None
+        )
+        if partner is None:
+            missed.append(ref)
+        else:
+            unused.remove(partner)
+            matched.append((ref, partner))
+    return matched, missed, unused
+
+BLINK_CLASSES = ("FB", "SB", "VSB")
+
+
+def load_labels(recording):
+    """
+    Hand labels for a recording: a JSON list of [timestamp, event] in a file
+    next to it with a .json suffix. None if there is no such file.
+    """
+    path = Path(recording).with_suffix(".json")
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return [(float(t), str(e)) for t, e in json.load(f)]
+
+
+def synthetic_trace(seconds=120.0, fps=30.0, seed=0, neutral_rest=True, noise=0.01):
+    """
+    (timestamps, scores, labels) of a simulated session at `fps`: blinks of
+    about 0.2, 0.55 and 1.1 s and short left/right glances on a resting face
+    with Gaussian `noise`. `labels` holds each gesture's true (timestamp,
+    event), timed where the detector reports it (eye reopened, gaze back) and
+    classed with the default 0.4 / 0.8 s blink limits.
+
+    With `neutral_rest` the resting left and right gaze scores are equal, so
+    after a glance the scores fall into the detector's gaze neutral zone and
+    the gaze stays latched; otherwise they rest 0.1 apart and a glance ends
+    on the first sample below the exit threshold.
+    """
+    rng = np.random.default_rng(seed)
+    n = int(seconds * fps)
+    timestamps = np.arange(n) / fps
+    look_left_cols = [LOOK_OUT_LEFT, LOOK_IN_RIGHT]
+    look_right_cols = [LOOK_OUT_RIGHT, LOOK_IN_LEFT]
+
+    rest = np.full(len(GESTURE_BLENDSHAPES), 0.05)
+    rest[look_left_cols] = 0.1 if neutral_rest else 0.05
+    rest[look_right_cols] = 0.1 if neutral_rest else 0.15
+    scores = rest + rng.normal(0, noise, (n, len(GESTURE_BLENDSHAPES)))
+
+    labels = []
+    i = int(fps)
+    while i < n - 2 * fps:
+        if rng.random() < 0.75:
+            length = max(int(round(rng.choice((0.2, 0.55, 1.1)) * np.exp(rng.normal(0, 0.1)) * fps)), 2)
+            scores[i:i + length, [LEFT_BLINK, RIGHT_BLINK]] = 0.85 + rng.normal(0, noise, (length, 2))
+            duration = length / fps
+            event = "FB" if duration < 0.4 else "SB" if duration < 0.8 else "VSB"
+        else:
+            left = rng.random() < 0.5
+            length = int(rng.integers(int(0.15 * fps), int(0.4 * fps)))
+            columns = look_left_cols if left else look_right_cols
+            scores[i:i + length, columns] = 0.75 + rng.normal(0, noise, (length, 2))
+            event = "FL" if left else "FR"
+        labels.append((float(timestamps[i + length]), event))
+        i += length + int(rng.uniform(1.0, 4.0) * fps)
+
+    return timestamps, np.clip(scores, 0, 1).astype(np.float32), labels
@@ -0,0 +1,99 @@
+"""
+Allocations and time per frame of the BGR -> RGB conversion.
+
+Compares cv2.cvtColor allocating a fresh array per frame with RgbConverter
+writing into reused buffers, on full frames and on ROI crops whose size
+drifts the way the face tracker's does. Allocation is measured with
+tracemalloc once the first frames have warmed the buffers up:
+    python -m benchmarks.convert_benchmark
+    python -m benchmarks.convert_benchmark --size 1280x720 --frames 2000 --mediapipe
+"""
+import argparse
+import tracemalloc
+from time import perf_counter
+
+import cv2
+import numpy as np
+
+from app.utils.frame_convert import RgbConverter
+
+WARM_UP = 20
+
+
+def allocating(image):
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+
+def make_inputs(width, height, count, roi):
+    rng = np.random.default_rng(0)
+    pool = [rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8) for _ in range(4)]
+    if not roi:
+        return [pool[i % len(pool)] for i in range(count)]
+    # Crops of +-8 px around a half-frame box, like a tracked face
+    crops = []
+    for i in range(count):
+        dx, dy = int(rng.integers(-8, 9)), int(rng.integers(-8, 9))
+        x0, y0 = width // 4 + dx, height // 4 + dy
+        crops.append(pool[i % len(pool)][y0:y0 + height // 2 + dy, x0:x0 + width // 2 + dx])
+    return crops
+
+
+def measure(convert, inputs, wrap=None):
+    """Returns (bytes allocated per frame, peak bytes, ms per frame) after warm-up."""
+    for image in inputs[:WARM_UP]:
+        convert(image)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    allocated = 0
+    for image in inputs[WARM_UP:]:
+        rgb = convert(image)
+        if wrap is not None:
+            rgb = wrap(rgb)
+        current = tracemalloc.get_traced_memory()[0]
+        allocated += max(0, current - before)
+        del rgb
+        before = tracemalloc.get_traced_memory()[0]
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    start = perf_counter()
+    for image in inputs[WARM_UP:]:
+        rgb = convert(image)
+        if wrap is not None:
+            rgb = wrap(rgb)
+    elapsed = perf_counter() - start
+
+    frames = len(inputs) - WARM_UP
+    return allocated / frames, peak, elapsed / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", default="640x480")
+    parser.add_argument("--frames", type=int, default=1000)
+    parser.add_argument("--mediapipe", action="store_true", help="also wrap each result in mp.Image")
+    args = parser.parse_args()
+
+    width, _, height = args.size.lower().partition("x")
+    width, height = int(width), int(height)
+
+    wrap = None
+    if args.mediapipe:
+        import mediapipe as mp
+        wrap = lambda rgb: mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+
+    for roi in (False, True):
+        inputs = make_inputs(width, height, args.frames + WARM_UP, roi)
+        converter = RgbConverter()
+        label = "ROI crops" if roi else "full frame"
+        for name, convert in (("cvtColor", allocating), ("RgbConverter", converter.convert)):
+            per_frame, peak, ms = measure(convert, inputs, wrap)
+            print(f"[bench] {label:<10} {name:<12}: {per_frame / 1024:8.1f} KiB allocated/frame, "
+                  f"peak {peak / 1024:8.1f} KiB, {ms:.3f} ms/frame")
+        print(f"[bench] {label:<10} RgbConverter buffer reallocations: {converter.reallocations}")
+
+
+if __name__ == "__main__":
+    main()
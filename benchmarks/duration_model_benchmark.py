@@ -0,0 +1,60 @@
+"""
+How the learned blink-duration boundaries follow a user who speeds up.
+
+Simulates a user typing Morse whose dot / dash / enter blinks shrink over the
+session (log-normal jitter around each target). A phase marked "noenter"
+has dots and dashes only (a long word, no letter ends), where the model
+must not let the dashes take over the enter class. Every blink is classified
+with the fixed 0.4 / 0.8 s limits and with a BlinkDurationModel learning
+online. Reports accuracy and the limits per phase; the gain in entry rate is
+the time a user at that speed no longer has to hold blinks for:
+    python -m benchmarks.duration_model_benchmark
+    python -m benchmarks.duration_model_benchmark --speeds 1.0,0.7,0.5 --blinks 300
+    python -m benchmarks.duration_model_benchmark --speeds 1.0noenter,1.0,0.6noenter,0.6
+"""
+import argparse
+
+import numpy as np
+
+from app.utils.blink_duration_model import BlinkDurationModel
+
+CLASSES = ("FB", "SB", "VSB")
+TARGETS = (0.2, 0.55, 1.1)  # seconds at speed 1.0
+MIX = (0.5, 0.35, 0.15)     # dots, dashes, letter ends
+NO_ENTER_MIX = (0.6, 0.4, 0.0)
+
+
+def classify(duration, max_fast, max_slow):
+    return "FB" if duration < max_fast else "SB" if duration < max_slow else "VSB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--speeds", default="1.0noenter,1.0,0.8,0.6,0.5",
+                        help="duration scale per phase, 'noenter' suffix for dots and dashes only")
+    parser.add_argument("--blinks", type=int, default=200, help="blinks per phase")
+    parser.add_argument("--jitter", type=float, default=0.15, help="log-normal sigma of blink durations")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    model = BlinkDurationModel()
+    for phase in args.speeds.split(","):
+        no_enter = phase.endswith("noenter")
+        speed = float(phase[:-len("noenter")] if no_enter else phase)
+        fixed_hits = learned_hits = 0
+        for _ in range(args.blinks):
+            intended = int(rng.choice(3, p=NO_ENTER_MIX if no_enter else MIX))
+            duration = float(TARGETS[intended] * speed * np.exp(rng.normal(0, args.jitter)))
+            fixed_hits += classify(duration, 0.4, 0.8) == CLASSES[intended]
+            learned_hits += classify(duration, *model.boundaries()) == CLASSES[intended]
+            model.observe(duration)
+
+        max_fast, max_slow = model.boundaries()
+        label = f"speed {speed:.2f}" + (" no enters" if no_enter else "")
+        print(f"[bench] {label:<20}: fixed {fixed_hits / args.blinks * 100:5.1f}%, "
+              f"learned {learned_hits / args.blinks * 100:5.1f}% "
+              f"(limits {max_fast:.2f} / {max_slow:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Compare the threshold GestureDetector with the HMM engine on recorded traces.
+
+Each recording is replayed through both engines. Accuracy is measured against
+hand labels when given (a JSON list of [timestamp, event] per recording, same
+file name with a .json suffix), otherwise against the threshold engine on the
+unmodified trace. --dim scales the blink scores to mimic a darker room, which
+is where fixed thresholds are expected to break down:
+    python -m benchmarks.engine_benchmark cache/recordings/*.npy
+    python -m benchmarks.engine_benchmark session.npy --dim 0.7 --lag 5
+"""
+import argparse
+from time import process_time
+
+from app.utils.blendshape_recorder import load_recording, replay
+from app.utils.eye_gesture_detector import LEFT_BLINK, RIGHT_BLINK
+from benchmarks.common import load_config, create_detector, match_events, load_labels
+
+ENGINES = ("threshold", "hmm")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recordings", nargs="+", help=".npy files written by BlendshapeRecorder")
+    parser.add_argument("--dim", type=float, default=1.0, help="scale blink scores by this factor")
+    parser.add_argument("--lag", type=int, default=None, help="HMM commit lag in samples")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="event match window (s)")
+    args = parser.parse_args()
+
+    cfg = load_config()
+    if args.lag is not None:
+        cfg["hmm_lag"] = args.lag
+
+    totals = {engine: dict(reference=0, matched=0, missed=0, extra=0, samples=0, cpu=0.0) for engine in ENGINES}
+    for recording in args.recordings:
+        timestamps, scores = load_recording(recording)
+        if len(timestamps) == 0:
+            continue
+        reference = load_labels(recording)
+        source = "labels"
+        if reference is None:
+            reference = replay(timestamps, scores, create_detector(dict(cfg, detector_engine="threshold")))
+            source = "threshold engine"
+
+        trace = scores
+        if args.dim != 1.0:
+            trace = scores.copy()
+            trace[:, [LEFT_BLINK, RIGHT_BLINK]] *= args.dim
+
+        print(f"[bench] {recording}: {len(timestamps)} samples, {len(reference)} reference events ({source})")
+        for engine in ENGINES:
+            detector = create_detector(dict(cfg, detector_engine=engine))
+            start = process_time()
+            events = replay(timestamps, trace, detector)
+            cpu = process_time() - start
+
+            matched, missed, extra = match_events(reference, events, args.tolerance)
+            total = totals[engine]
+            total["reference"] += len(reference)
+            total["matched"] += len(matched)
+            total["missed"] += len(missed)
+            total["extra"] += len(extra)
+            total["samples"] += len(timestamps)
+            total["cpu"] += cpu
+
+    for engine, total in totals.items():
+        if not total["samples"]:
+            continue
+        accuracy = total["matched"] / max(total["reference"], 1) * 100
+        print(f"[bench] {engine:<9}: {accuracy:5.1f}% of {total['reference']} events matched, "
+              f"{total['missed']} missed, {total['extra']} extra, "
+              f"{total['cpu'] / total['samples'] * 1e6:.1f} us CPU/sample")
+
+
+if __name__ == "__main__":
+    main()
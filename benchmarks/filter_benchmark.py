@@ -0,0 +1,100 @@
+"""
+Effect of the detector's signal filters on false events and event latency.
+
+Events are scored against hand labels when the recording has them (a JSON
+list of [timestamp, event], same file name with a .json suffix), or against
+the true gestures of a simulated session with --synthetic. Otherwise the
+reference is the unfiltered detector on the clean trace. That is not ground
+truth: its gaze events end late while neutral-zone samples keep the gaze
+latched, so a filter that ends them on time shows up as "missed" and
+"false" there. Blinks and gaze events are therefore scored on separate rows;
+the simulated session rests outside the neutral zone so neither is affected.
+
+Each filter replays the clean trace and one with single-frame spikes
+injected (the noise the filters are for). Events with no reference partner
+count as false, and matched events report how much later they fire:
+    python -m benchmarks.filter_benchmark cache/recordings/session.npy
+    python -m benchmarks.filter_benchmark session.npy --spike-rate 0.02 --filters ema,median3
+    python -m benchmarks.filter_benchmark --synthetic 600
+"""
+import argparse
+import statistics
+
+import numpy as np
+
+from app.utils.blendshape_recorder import load_recording, replay
+from benchmarks.common import load_config, create_detector, match_events, load_labels, synthetic_trace, BLINK_CLASSES
+
+FILTER_KINDS = ("none", "ema", "one_euro", "median3")
+
+
+def add_spikes(scores, rate, seed=0):
+    """Copy of `scores` where a `rate` fraction of samples has one score jump to 0 or 1."""
+    rng = np.random.default_rng(seed)
+    spiked = scores.copy()
+    rows = np.flatnonzero(rng.random(len(scores)) < rate)
+    columns = rng.integers(0, scores.shape[1], len(rows))
+    spiked[rows, columns] = np.where(spiked[rows, columns] < 0.5, 1.0, 0.0)
+    return spiked, len(rows)
+
+
+def score(reference, events, tolerance, minutes):
+    """'false/min, missed, latency' summary of `events` against `reference`."""
+    matched, missed, extra = match_events(reference, events, tolerance)
+    delays = [candidate[0] - ref[0] for ref, candidate in matched]
+    delay = statistics.mean(delays) * 1000 if delays else 0.0
+    return f"{len(extra) / minutes:5.2f} false/min, {len(missed):3d} missed, latency {delay:+4.0f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording", nargs="?", help=".npy file written by BlendshapeRecorder")
+    parser.add_argument("--synthetic", type=float, default=None, metavar="SECONDS",
+                        help="use a simulated session of this length, scored against its true gestures")
+    parser.add_argument("--spike-rate", type=float, default=0.01, help="fraction of samples with a spike")
+    parser.add_argument("--filters", default=",".join(FILTER_KINDS))
+    parser.add_argument("--tolerance", type=float, default=0.25, help="event match window (s)")
+    args = parser.parse_args()
+    kinds = args.filters.split(",")
+    unknown = [kind for kind in kinds if kind not in FILTER_KINDS]
+    if unknown:
+        parser.error(f"unknown filter(s) {', '.join(unknown)}; choose from {', '.join(FILTER_KINDS)}")
+    if args.recording is None and args.synthetic is None:
+        parser.error("give a recording or --synthetic SECONDS")
+
+    if args.synthetic is not None:
+        timestamps, scores, reference = synthetic_trace(args.synthetic, neutral_rest=False)
+        source = "simulated gestures"
+    else:
+        timestamps, scores = load_recording(args.recording)
+        reference = load_labels(args.recording)
+        source = "labels"
+    if len(timestamps) == 0:
+        print("[bench] Recording is empty.")
+        return
+    minutes = float(timestamps[-1] - timestamps[0]) / 60 or 1.0
+    cfg = load_config()
+
+    if reference is None:
+        reference = replay(timestamps, scores, create_detector(dict(cfg, signal_filter="none")))
+        source = "unfiltered detector, not ground truth"
+    spiked, spikes = add_spikes(scores, args.spike_rate)
+    print(f"[bench] reference    : {len(reference)} events in {minutes:.1f} min ({source}), "
+          f"{spikes} spikes injected")
+
+    def blinks(events):
+        return [e for e in events if e[1] in BLINK_CLASSES]
+
+    def gazes(events):
+        return [e for e in events if e[1] not in BLINK_CLASSES]
+
+    for kind in kinds:
+        kind_cfg = dict(cfg, signal_filter=kind)
+        for label, stream in (("clean", scores), ("spiked", spiked)):
+            events = replay(timestamps, stream, create_detector(kind_cfg))
+            print(f"[bench] {kind:<9} {label:<6}: blinks {score(blinks(reference), blinks(events), args.tolerance, minutes)}")
+            print(f"[bench] {'':<16}  gaze   {score(gazes(reference), gazes(events), args.tolerance, minutes)}")
+
+
+if __name__ == "__main__":
+    main()
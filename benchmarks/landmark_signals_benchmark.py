@@ -0,0 +1,87 @@
+"""
+Compare landmark-only gesture signals with the blendshape head.
+
+Runs a recorded session video through the landmarker twice -- with blendshapes
+feeding the GestureDetector, and without them, scoring eye aspect ratio and
+iris offset from the landmarks -- and reports time per frame and how many
+events the two agree on:
+    python -m benchmarks.landmark_signals_benchmark session.mp4
+    python -m benchmarks.landmark_signals_benchmark session.mp4 --tolerance 0.3
+"""
+import argparse
+from time import perf_counter
+
+from app.core.eye_gesture import load_config, create_signal_extractor
+from app.utils.blendshape_vector import BlendshapeVector
+from app.utils.frame_sources import VideoFileSource
+from benchmarks.common import create_detector, create_landmarker, to_mp_image, match_events
+
+
+def run(video_path, landmarks):
+    """Returns (events, frames, landmarker seconds, extraction seconds)."""
+    cfg = load_config()
+    landmarker = create_landmarker(blendshapes=not landmarks)
+    extractor = create_signal_extractor(cfg) if landmarks else BlendshapeVector()
+    detector = create_detector(cfg)
+    source = VideoFileSource(video_path)
+
+    events = []
+    frames = 0
+    infer_time = extract_time = 0.0
+    while True:
+        success, image = source.read()
+        if not success:
+            break
+        timestamp = source.backend_timestamp()
+        frames += 1
+
+        mp_image = to_mp_image(image)
+        start = perf_counter()
+        result = landmarker.detect(mp_image)
+        infer_time += perf_counter() - start
+
+        start = perf_counter()
+        if landmarks:
+            if not result.face_landmarks:
+                continue
+            h, w = image.shape[:2]
+            scores = extractor.fill(result.face_landmarks[0], aspect=w / h)
+        else:
+            if not result.face_blendshapes:
+                continue
+            scores = extractor.fill(result.face_blendshapes[0])
+        extract_time += perf_counter() - start
+
+        for event in detector.update_scores(scores, timestamp):
+            events.append((timestamp, event))
+
+    source.release()
+    landmarker.close()
+    return events, frames, infer_time, extract_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("video", help="recorded session video")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="event match window (s)")
+    args = parser.parse_args()
+
+    results = {}
+    for label, landmarks in (("blendshapes", False), ("landmarks", True)):
+        events, frames, infer_time, extract_time = run(args.video, landmarks)
+        results[label] = events
+        print(f"[bench] {label:<11}: landmarker {infer_time / frames * 1000:.2f} ms/frame, "
+              f"scores {extract_time / frames * 1e6:.1f} us/frame, {len(events)} events")
+
+    matched, missed, extra = match_events(results["blendshapes"], results["landmarks"], args.tolerance)
+    reference = max(len(results["blendshapes"]), 1)
+    print(f"[bench] agreement  : {len(matched)}/{len(results['blendshapes'])} blendshape events matched "
+          f"({len(matched) / reference * 100:.0f}%), {len(missed)} missed, {len(extra)} extra")
+    for timestamp, event in missed:
+        print(f"[bench]   missed {event} at {timestamp:.2f} s")
+    for timestamp, event in extra:
+        print(f"[bench]   extra  {event} at {timestamp:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Cost and effect of low-light enhancement on the face region.
+
+Runs a session video through the landmarker with and without LowLightEnhancer
+(optionally darkening it first to simulate a night-time ward) and reports the
+added time per frame, how often a face was found, and the frame-to-frame
+jitter of the blink score while the eyes are open -- the noise that makes
+calibration drift:
+    python -m benchmarks.low_light_benchmark session.mp4
+    python -m benchmarks.low_light_benchmark night.mp4 --mode clahe
+    python -m benchmarks.low_light_benchmark session.mp4 --darken 0.3
+"""
+import argparse
+from time import perf_counter
+
+import cv2
+import numpy as np
+
+from app.utils.blendshape_vector import BlendshapeVector
+from app.utils.eye_gesture_detector import LEFT_BLINK, RIGHT_BLINK
+from app.utils.frame_sources import VideoFileSource
+from app.utils.low_light import LowLightEnhancer
+from benchmarks.common import create_detector, create_landmarker
+
+
+def run(video_path, darken, enhancer=None):
+    """Returns (frames, faces found, blink scores, events, enhancement seconds)."""
+    import mediapipe as mp
+
+    landmarker = create_landmarker()
+    detector = create_detector()
+    vector = BlendshapeVector()
+    source = VideoFileSource(video_path)
+
+    frames = faces = 0
+    blinks, events = [], []
+    enhance_time = 0.0
+    while True:
+        success, image = source.read()
+        if not success:
+            break
+        timestamp = source.backend_timestamp()
+        frames += 1
+        if darken < 1.0:
+            image = cv2.convertScaleAbs(image, alpha=darken)
+
+        rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        h, w = image.shape[:2]
+        if enhancer is not None:
+            start = perf_counter()
+            enhancer.process(rgb, (0, 0, w, h))
+            enhance_time += perf_counter() - start
+
+        result = landmarker.detect(mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb))
+        if enhancer is not None:
+            start = perf_counter()
+            enhancer.track(result, (0, 0, w, h), image.shape)
+            enhance_time += perf_counter() - start
+        if not result.face_blendshapes:
+            continue
+
+        faces += 1
+        scores = vector.fill(result.face_blendshapes[0])
+        blinks.append(float(scores[LEFT_BLINK] + scores[RIGHT_BLINK]) / 2)
+        for event in detector.update_scores(scores, timestamp):
+            events.append((timestamp, event))
+
+    source.release()
+    landmarker.close()
+    return frames, faces, np.array(blinks), events, enhance_time
+
+
+def jitter(blinks, open_threshold):
+    """Mean absolute frame-to-frame change of the blink score while the eyes are open."""
+    if len(blinks) < 2:
+        return 0.0
+    steps = np.abs(np.diff(blinks))
+    open_eyes = (blinks[1:] < open_threshold) & (blinks[:-1] < open_threshold)
+    return float(steps[open_eyes].mean()) if open_eyes.any() else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("video", help="recorded session video")
+    parser.add_argument("--mode", choices=("gamma", "clahe"), default="gamma")
+    parser.add_argument("--threshold", type=float, default=60)
+    parser.add_argument("--darken", type=float, default=1.0, help="scale frames by this factor first (0-1)")
+    args = parser.parse_args()
+
+    open_threshold = create_detector().open_threshold
+    for label, enhancer in (
+        ("plain", None),
+        (args.mode, LowLightEnhancer(threshold=args.threshold, mode=args.mode)),
+    ):
+        frames, faces, blinks, events, enhance_time = run(args.video, args.darken, enhancer)
+        enhanced = f", {enhancer.enhanced} frames enhanced" if enhancer is not None else ""
+        print(f"[bench] {label:<6}: face in {faces}/{frames} frames, blink jitter {jitter(blinks, open_threshold):.4f}, "
+              f"{len(events)} events, +{enhance_time / frames * 1000:.3f} ms/frame{enhanced}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Measure what motion-gated inference saves against always-infer.
+
+Runs the landmarker + GestureDetector over a recorded session video twice and
+reports CPU time, landmarker runs and events missed or added by the gate:
+    python -m benchmarks.motion_gate_benchmark session.mp4
+    python -m benchmarks.motion_gate_benchmark session.mp4 --threshold 2 --refresh-ms 500
+"""
+import argparse
+from time import perf_counter, process_time
+
+from app.utils.blendshape_vector import BlendshapeVector
+from app.utils.frame_sources import VideoFileSource
+from app.utils.motion_gate import MotionGate
+from benchmarks.common import create_detector, create_landmarker, to_mp_image, match_events
+
+
+def run(video_path, gate=None):
+    """Returns (events, frames, landmarker runs, cpu seconds, wall seconds)."""
+    landmarker = create_landmarker()
+    detector = create_detector()
+    vector = BlendshapeVector()
+    source = VideoFileSource(video_path)
+
+    events = []
+    frames = inferred = 0
+    face_present = False
+    cpu_start, wall_start = process_time(), perf_counter()
+
+    while True:
+        success, image = source.read()
+        if not success:
+            break
+        timestamp = source.backend_timestamp()
+        frames += 1
+
+        if gate is None or gate.should_infer(image, timestamp):
+            result = landmarker.detect(to_mp_image(image))
+            inferred += 1
+            if gate is not None:
+                h, w = image.shape[:2]
+                gate.track(result, (0, 0, w, h), image.shape)
+                gate.mark_inferred(image, timestamp)
+            face_present = bool(result.face_blendshapes)
+            if face_present:
+                vector.fill(result.face_blendshapes[0])
+
+        if face_present:
+            for event in detector.update_scores(vector.scores, timestamp):
+                events.append((timestamp, event))
+
+    cpu, wall = process_time() - cpu_start, perf_counter() - wall_start
+    source.release()
+    landmarker.close()
+    return events, frames, inferred, cpu, wall
+
+
+def report(label, frames, inferred, cpu, wall):
+    print(f"[bench] {label:<13}: {inferred}/{frames} landmarker runs, "
+          f"{cpu / frames * 1000:.2f} ms CPU/frame, {cpu / wall * 100:.0f}% CPU")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("video", help="recorded session video")
+    parser.add_argument("--threshold", type=float, default=3.0, help="mean abs change (0-255)")
+    parser.add_argument("--refresh-ms", type=float, default=300)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="event match window (s)")
+    args = parser.parse_args()
+
+    baseline, frames, inferred, cpu_base, wall = run(args.video)
+    report("always-infer", frames, inferred, cpu_base, wall)
+
+    gate = MotionGate(threshold=args.threshold, refresh_ms=args.refresh_ms)
+    gated, frames, inferred, cpu_gated, wall = run(args.video, gate)
+    report("motion-gated", frames, inferred, cpu_gated, wall)
+
+    matched, missed, extra = match_events(baseline, gated, args.tolerance)
+    print(f"[bench] CPU saved    : {(1 - cpu_gated / max(cpu_base, 1e-9)) * 100:.0f}%")
+    print(f"[bench] events       : {len(baseline)} always-infer, {len(matched)} matched, "
+          f"{len(missed)} missed, {len(extra)} extra")
+    for timestamp, event in missed:
+        print(f"[bench]   missed {event} at {timestamp:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Headless load test of the vision -> gesture -> Morse pipeline.
+
+Runs the real capture thread, landmarker and GestureDetector against any
+frame source and reports the frame rate this machine sustains:
+    python -m benchmarks.pipeline_benchmark --source synthetic:640x480
+    python -m benchmarks.pipeline_benchmark --source video:session.mp4
+    python -m benchmarks.pipeline_benchmark --source images:frames/ --seconds 30
+"""
+import argparse
+import os
+from time import perf_counter
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default="synthetic:640x480", help="frame source spec")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--morse", action="store_true",
+                        help="also decode events to text (needs GROQ_API_KEY for speech)")
+    args = parser.parse_args()
+
+    # Must be set before the vision pipeline is imported
+    os.environ["DRISHTI_SOURCE"] = args.source
+    from app.core import eye_gesture
+    gestures = eye_gesture.subscribe_gestures()
+    engine = eye_gesture.get_engine()
+
+    decode = None
+    if args.morse:
+        from app.utils.morse_decoder import event_to_letter
+        decode = event_to_letter
+
+    buffer, text = "", ""
+    events = 0
+    latencies = []
+    first_frame = engine.frames_processed
+    start = perf_counter()
+    deadline = start + args.seconds
+
+    while perf_counter() < deadline and engine.running:
+        gesture = gestures.get_event(timeout=0.2)
+        if gesture is None:
+            continue
+        events += 1
+        latencies.append(gesture.latency)
+        if decode is not None:
+            buffer, text = decode(gesture.name, buffer, text)
+
+    elapsed = perf_counter() - start
+    frames = engine.frames_processed - first_frame
+    stats = engine.stats()
+    eye_gesture.release_camera()
+
+    print(f"[bench] source     : {args.source}")
+    print(f"[bench] processed  : {frames} frames in {elapsed:.1f} s -> {frames / elapsed:.1f} fps")
+    print(f"[bench] dropped    : {stats.get('dropped', 0)} frames never processed")
+    print(f"[bench] inference  : {stats.get('inferred', 0)} inferred, {stats.get('skipped', 0)} skipped")
+    print(f"[bench] events     : {events}")
+    if latencies:
+        print(f"[bench] latency    : {sum(latencies) / len(latencies) * 1000:.1f} ms mean, "
+              f"{max(latencies) * 1000:.1f} ms max (capture -> event)")
+    if decode is not None:
+        print(f"[bench] text       : {text!r}")
+
+
+if __name__ == "__main__":
+    main()
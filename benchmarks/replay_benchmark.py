@@ -0,0 +1,67 @@
+"""
+Replay a recorded blendshape stream through GestureDetector without a camera.
+
+Record a session first:
+    DRISHTI_RECORD=cache/recordings/session.npy python main.py
+
+Then replay it (from the repo root):
+    python -m benchmarks.replay_benchmark cache/recordings/session.npy
+
+Prints throughput, the speed relative to real time and a digest of the event
+sequence; two runs over the same file must print the same digest. The
+vectorized detect_batch() is timed too and must produce the same digest.
+"""
+import argparse
+from time import perf_counter
+
+from app.utils.batch_gesture_detector import detect_batch, can_vectorize
+from app.utils.blendshape_recorder import load_recording, replay
+from benchmarks.common import load_config, create_detector, event_digest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording", help=".npy file written by BlendshapeRecorder")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    timestamps, scores = load_recording(args.recording)
+    if len(timestamps) == 0:
+        print("[bench] Recording is empty.")
+        return
+    session_seconds = float(timestamps[-1] - timestamps[0])
+    cfg = load_config()
+
+    digests = set()
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = perf_counter()
+        events = replay(timestamps, scores, create_detector(cfg))
+        best = min(best, perf_counter() - start)
+        digests.add(event_digest(events))
+
+    counts = {}
+    for _, event in events:
+        counts[event] = counts.get(event, 0) + 1
+
+    print(f"[bench] samples      : {len(timestamps)} ({session_seconds:.1f} s of session)")
+    print(f"[bench] replay time  : {best * 1000:.1f} ms  ({len(timestamps) / best:,.0f} samples/s)")
+    print(f"[bench] vs real time : {session_seconds / best:,.0f}x")
+    print(f"[bench] events       : {counts}")
+    print(f"[bench] digest       : {' / '.join(sorted(digests))}")
+    if len(digests) != 1:
+        raise SystemExit("[bench] Replays produced different event sequences!")
+
+    batch_best = float("inf")
+    for _ in range(args.repeat):
+        start = perf_counter()
+        batch_events = detect_batch(timestamps, scores, create_detector(cfg))
+        batch_best = min(batch_best, perf_counter() - start)
+    mode = "vectorized" if can_vectorize(create_detector(cfg)) else "streaming fallback"
+    print(f"[bench] batch        : {batch_best * 1000:.1f} ms ({mode}, {best / batch_best:,.0f}x the replay)")
+    if event_digest(batch_events) not in digests:
+        raise SystemExit("[bench] detect_batch() disagrees with the streaming detector!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Compare landmarker cost on full frames versus face-ROI crops.
+
+Usage (from the repo root):
+    python -m benchmarks.roi_benchmark path/to/session.mp4
+"""
+import argparse
+from time import perf_counter
+
+import cv2
+
+from app.utils.roi_tracker import RoiTracker
+from benchmarks.common import create_landmarker, to_mp_image
+
+
+def run(video_path, model_path, roi_tracker=None, max_frames=None):
+    """Returns (frames, mean ms per frame, frames with a face)."""
+    detector = create_landmarker(model_path)
+    cap = cv2.VideoCapture(video_path)
+    frames = faces = 0
+    total = 0.0
+
+    while max_frames is None or frames < max_frames:
+        success, image = cap.read()
+        if not success:
+            break
+
+        start = perf_counter()
+        frame_shape = image.shape
+        region = None
+        if roi_tracker is not None:
+            image, region = roi_tracker.crop(image)
+        result = detector.detect(to_mp_image(image))
+        if roi_tracker is not None:
+            roi_tracker.update(result, region, frame_shape)
+        total += perf_counter() - start
+
+        frames += 1
+        faces += bool(result.face_blendshapes)
+
+    cap.release()
+    detector.close()
+    return frames, (total / max(frames, 1)) * 1000, faces
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("video", help="recorded session video")
+    parser.add_argument("--model", default="data/face_landmarker.task")
+    parser.add_argument("--max-frames", type=int, default=None)
+    parser.add_argument("--padding", type=float, default=0.25)
+    parser.add_argument("--refresh", type=int, default=30, help="full frame every N frames")
+    args = parser.parse_args()
+
+    frames, full_ms, full_faces = run(args.video, args.model, max_frames=args.max_frames)
+    print(f"[bench] full frame : {full_ms:7.2f} ms/frame  ({full_faces}/{frames} frames with face)")
+
+    tracker = RoiTracker(padding=args.padding, refresh_interval=args.refresh)
+    frames, roi_ms, roi_faces = run(args.video, args.model, tracker, max_frames=args.max_frames)
+    print(f"[bench] face ROI   : {roi_ms:7.2f} ms/frame  ({roi_faces}/{frames} frames with face)")
+
+    if roi_ms > 0:
+        print(f"[bench] speed-up   : {full_ms / roi_ms:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Sustained frame rate per session as the ward grows.
+
+Starts 1, 2, ... N patient sessions on paced synthetic (or recorded) sources
+and reports the fps each session actually gets through the landmarker and
+GestureDetector, plus how evenly the scheduler shared its time:
+    python -m benchmarks.ward_benchmark --max-sessions 4
+    python -m benchmarks.ward_benchmark --max-sessions 8 --source video:session.mp4 --fps 30 --workers 4
+"""
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+from time import sleep
+
+import yaml
+
+from app.core.eye_gesture import load_config
+from app.core.session_manager import SessionManager, localize_paths
+
+
+def write_session_config(sessions_dir, session_id, source, fps):
+    """Seed a session's config.yaml with its own frame source."""
+    directory = Path(sessions_dir) / session_id
+    directory.mkdir(parents=True, exist_ok=True)
+    cfg = localize_paths(load_config(), directory)
+    cfg.update(frame_source=source, frame_source_fps=fps, frame_source_loop=True)
+    with open(directory / "config.yaml", "w") as f:
+        yaml.safe_dump(cfg, f)
+
+
+def run(count, args, sessions_dir):
+    """Returns the per-session stats after `args.seconds` with `count` sessions."""
+    manager = SessionManager(workers=args.workers, sessions_dir=sessions_dir)
+    for i in range(count):
+        session_id = f"bed{i + 1}"
+        write_session_config(sessions_dir, session_id, args.source, args.fps)
+        manager.add_session(session_id, typing=False)
+
+    manager.start()
+    sleep(args.seconds)
+    stats = manager.stats()
+    manager.stop()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-sessions", type=int, default=4)
+    parser.add_argument("--source", default="synthetic:640x480", help="frame source spec for every session")
+    parser.add_argument("--fps", type=float, default=30.0, help="pace of each session's source")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--workers", type=int, default=None, help="scheduler threads (default: cores - 1)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as sessions_dir:
+        for count in range(1, args.max_sessions + 1):
+            stats = run(count, args, sessions_dir)
+            fps = [s["fps"] for s in stats.values()]
+            busy = [s["busy"] for s in stats.values()]
+            spread = (max(busy) - min(busy)) / max(max(busy), 1e-9) * 100
+            print(f"[bench] {count} session(s): {statistics.mean(fps):5.1f} fps/session "
+                  f"(min {min(fps):.1f}, max {max(fps):.1f}), total {sum(fps):.1f} fps, "
+                  f"busy-time spread {spread:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
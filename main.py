@@ -1,6 +1,7 @@
 import json
 import os
 import tkinter as tk
+from app.core.eye_gesture import warm_up_async, release_camera
 from app.main_ui import DrishtiKeyboardUI
 from app.calibration_ui import run_calibration_ui
 from app.learn_ui import run_learn_ui
@@ -22,6 +23,9 @@ def save_progress(data):
         json.dump(data, f, indent=4)
 
 if __name__ == '__main__':
+    # Load the face model and open the camera while the first window comes up
+    warm_up_async()
+
     progress = load_progress()
 
     # Shared hidden root for the first two UIs
@@ -46,3 +50,7 @@ if __name__ == '__main__':
     print("[INFO] Launching Drishti Keyboard UI...")
     app = DrishtiKeyboardUI()
     app.mainloop()
+
+    # Stop the vision pipeline so the recording, learned blink durations and
+    # trace are written (a worker process would otherwise just be killed)
+    release_camera()